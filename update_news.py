@@ -6,21 +6,28 @@ AI News Shorts - Batch Processing with 10-day Rolling Window
 
 import os
 import re
+import sys
 import json
 import time
-import base64
-import hmac
 import hashlib
-from datetime import datetime, timedelta
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from urllib.parse import urlparse
-import xml.etree.ElementTree as ET
-from dotenv import load_dotenv
-import requests
-import pytz
 
-load_dotenv()
+# requests, xml.etree and Pillow are imported by the stages that use them, so
+# render-only and CLI invocations do not pay for them at startup
 
-KST = pytz.timezone('Asia/Seoul')
+if os.path.exists('.env'):
+    from dotenv import load_dotenv
+    load_dotenv()
+
+try:
+    from zoneinfo import ZoneInfo
+    KST = ZoneInfo('Asia/Seoul')
+except Exception:
+    # No tz database (e.g. Windows without tzdata): Korea has no DST, a fixed offset is exact
+    KST = timezone(timedelta(hours=9), 'KST')
 
 def get_kst_now():
     return datetime.now(KST)
@@ -144,6 +151,159 @@ def log_message(message):
     timestamp = get_kst_timestamp()
     print(f"[{timestamp}] {message}")
 
+_http_session = None
+
+def get_http_session():
+    """Shared HTTP session so keep-alive connections stay warm across requests"""
+    global _http_session
+    if _http_session is None:
+        import requests
+        _http_session = requests.Session()
+    return _http_session
+
+# ============================================================
+# Run Deadlines & Hedged Requests
+# ============================================================
+
+RUN_BUDGET = int(os.getenv('RUN_BUDGET_SECONDS', 25 * 60))
+STAGE_BUDGETS = {
+    'rss': 4 * 60,
+    'curation': 2 * 60,
+    'summarize': 12 * 60,                # og:image crawling overlaps this stage
+    'huggingface': 5 * 60,
+    'images': 2 * 60,
+    'mirror': 5 * 60
+}
+MIN_REQUEST_TIMEOUT = 1.0
+HEDGE_PERCENTILE = 0.9
+HEDGE_DEFAULT_DELAY = 3.0                # until a host has enough latency samples
+HEDGE_MIN_DELAY = 0.5
+HEDGE_MIN_SAMPLES = 5
+
+class Deadline:
+    """Absolute time budget; a child deadline never outlives its parent"""
+    
+    def __init__(self, seconds, parent=None):
+        self.expires_at = time.time() + seconds
+        if parent is not None:
+            self.expires_at = min(self.expires_at, parent.expires_at)
+    
+    def remaining(self):
+        return max(0.0, self.expires_at - time.time())
+    
+    def expired(self):
+        return self.remaining() <= 0
+
+_run_deadline = None
+_stage_deadline = None
+
+def start_run_deadline(seconds=RUN_BUDGET):
+    global _run_deadline
+    _run_deadline = Deadline(seconds)
+    return _run_deadline
+
+@contextmanager
+def run_deadline(seconds=RUN_BUDGET):
+    """Fresh run budget for one unit of daemon work, cleared afterwards so the
+    next poll never inherits an expired deadline"""
+    global _run_deadline
+    start_run_deadline(seconds)
+    try:
+        yield _run_deadline
+    finally:
+        _run_deadline = None
+
+@contextmanager
+def stage_deadline(name):
+    """Give a pipeline stage its budget, bounded by what is left of the run"""
+    global _stage_deadline
+    previous = _stage_deadline
+    _stage_deadline = Deadline(STAGE_BUDGETS[name], parent=_run_deadline)
+    try:
+        yield _stage_deadline
+    finally:
+        _stage_deadline = previous
+
+def active_deadline():
+    return _stage_deadline or _run_deadline
+
+def deadline_exceeded():
+    deadline = active_deadline()
+    return deadline is not None and deadline.expired()
+
+def request_timeout(cap):
+    """Per-request timeout that inherits whatever is left of the active deadline"""
+    deadline = active_deadline()
+    if deadline is None:
+        return cap
+    return max(MIN_REQUEST_TIMEOUT, min(cap, deadline.remaining()))
+
+_host_latencies = {}
+_hedge_executor = None
+
+def record_host_latency(host, seconds):
+    from collections import deque
+    _host_latencies.setdefault(host, deque(maxlen=50)).append(seconds)
+
+def hedge_delay(host):
+    """Seconds to wait before firing a backup request: the host's p90 latency"""
+    samples = sorted(_host_latencies.get(host, ()))
+    if len(samples) < HEDGE_MIN_SAMPLES:
+        return HEDGE_DEFAULT_DELAY
+    return max(HEDGE_MIN_DELAY, samples[int(HEDGE_PERCENTILE * (len(samples) - 1))])
+
+def hedged_get(url, timeout, **kwargs):
+    """Idempotent GET that sends one backup request once the first is slower than p90
+    
+    The first response to arrive wins; the slower request is left to finish in the
+    background and its response is closed as soon as it arrives, so streamed bodies
+    never pin a pooled connection. timeout is capped by the active deadline.
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    global _hedge_executor
+    if _hedge_executor is None:
+        _hedge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='hedge')
+    
+    timeout = request_timeout(timeout)
+    host = urlparse(url).netloc
+    started = time.time()
+    
+    def timed_get():
+        request_started = time.time()
+        response = get_http_session().get(url, timeout=timeout, **kwargs)
+        record_host_latency(host, time.time() - request_started)
+        return response
+    
+    pending = {_hedge_executor.submit(timed_get)}
+    delay = hedge_delay(host)
+    done, _ = wait(pending, timeout=min(delay, timeout))
+    if not done and timeout - delay > MIN_REQUEST_TIMEOUT:
+        pending.add(_hedge_executor.submit(timed_get))
+    
+    def close_loser(future):
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
+    
+    error = None
+    winner = None
+    while pending and winner is None:
+        done, pending = wait(pending, timeout=max(0.1, timeout + 1 - (time.time() - started)), return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for future in done:
+            if winner is not None:
+                close_loser(future)
+                continue
+            try:
+                winner = future.result()
+            except Exception as e:
+                error = e
+    for future in pending:
+        future.add_done_callback(close_loser)
+    if winner is not None:
+        return winner
+    raise error or TimeoutError(f"GET {url} exceeded {timeout:.0f}s")
+
 def is_english_text(text):
     """Check if text is primarily English"""
     if not text:
@@ -152,18 +312,358 @@ def is_english_text(text):
     total_chars = len(text.strip())
     return total_chars > 0 and (english_chars / total_chars) > 0.5
 
+# ============================================================
+# Structured LLM Output (JSON)
+# ============================================================
+
+GLM_API_URL = "https://api.z.ai/api/coding/paas/v4/chat/completions"
+GLM_MODEL = 'glm-4.7'
+GLM_STREAMING = os.getenv('GLM_STREAMING', '1') != '0'
+
+class LLMAPIError(Exception):
+    """Non-200 or empty response from the chat completions endpoint"""
+
+def strip_code_fence(content):
+    """Remove a surrounding ```json ... ``` fence that models like to add"""
+    content = content.strip()
+    if content.startswith('```'):
+        content = re.sub(r'^```[a-zA-Z]*\s*', '', content)
+        content = re.sub(r'\s*```$', '', content)
+    return content
+
+def parse_json_object(content):
+    """Parse a reply that should be one JSON object, returns dict or None"""
+    content = strip_code_fence(content)
+    start, end = content.find('{'), content.rfind('}')
+    if start == -1 or end <= start:
+        return None
+    try:
+        parsed = json.loads(content[start:end + 1])
+    except json.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+def parse_json_lines(content):
+    """Parse a JSON-lines reply into a list of objects, skipping lines that don't parse
+    
+    A reply wrapped in a single array or {"articles": [...]} object is accepted too.
+    """
+    content = strip_code_fence(content)
+    records = []
+    for line in content.splitlines():
+        line = line.strip().rstrip(',')
+        if not line.startswith('{'):
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict):
+            records.append(record)
+    
+    if not records:
+        try:
+            parsed = json.loads(content)
+        except json.JSONDecodeError:
+            return []
+        if isinstance(parsed, dict):
+            parsed = parsed.get('articles', [])
+        if isinstance(parsed, list):
+            records = [r for r in parsed if isinstance(r, dict)]
+    return records
+
+def validate_summary_lines(value):
+    """Schema check for a four-bullet summary, returns the 4 lines or None"""
+    if isinstance(value, str):
+        value = [line.strip().lstrip('•-').strip() for line in value.splitlines()]
+    if not isinstance(value, list):
+        return None
+    lines = [str(v).strip().lstrip('•-').strip() for v in value if isinstance(v, str) and v.strip()]
+    if len(lines) < 4:
+        return None
+    return lines[:4]
+
+def validate_article_record(record, batch_size):
+    """Schema check for one summarized article, returns (index, fields) or None"""
+    try:
+        idx = int(record.get('id')) - 1
+    except (TypeError, ValueError):
+        return None
+    if idx < 0 or idx >= batch_size:
+        return None
+    
+    title = record.get('title')
+    keyword = record.get('keyword')
+    summary = validate_summary_lines(record.get('summary'))
+    if not isinstance(title, str) or not title.strip() or summary is None:
+        return None
+    if not isinstance(keyword, str) or not keyword.strip():
+        return None
+    
+    return idx, {
+        'translated_title': title.strip(),
+        'summary': '\n'.join(f'• {line}' for line in summary),
+        'category_keyword': keyword.strip()
+    }
+
+# ============================================================
+# LLM Provider Routing
+# ============================================================
+
+LLM_UNKNOWN_LATENCY = 10.0               # assumed cost of a provider with no samples yet
+LLM_LATENCY_ALPHA = 0.3
+LLM_FAILURE_THRESHOLD = 2                # consecutive failures before a provider cools down
+LLM_BASE_COOLDOWN = 5 * 60
+LLM_MAX_COOLDOWN = 60 * 60
+
+def load_llm_providers():
+    """OpenAI-compatible chat endpoints in priority order
+    
+    GLM is the default. LLM_PROVIDERS (a JSON list of {name, url, model, api_key_env,
+    json_mode}) adds hosted endpoints, and LOCAL_LLM_URL adds a local stand-in server
+    such as llama.cpp or vLLM, which needs no key.
+    """
+    providers = []
+    if GLM_API_KEY:
+        providers.append({'name': 'glm', 'url': GLM_API_URL, 'model': GLM_MODEL, 'api_key': GLM_API_KEY,
+                          'json_mode': True, 'extra': {'thinking': {'type': 'disabled'}}})
+    try:
+        configured = json.loads(os.getenv('LLM_PROVIDERS', '[]'))
+    except json.JSONDecodeError:
+        log_message("LLM_PROVIDERS is not valid JSON, ignoring it")
+        configured = []
+    if not isinstance(configured, list):
+        log_message("LLM_PROVIDERS must be a JSON list, ignoring it")
+        configured = []
+    for entry in configured:
+        if not isinstance(entry, dict) or not entry.get('url') or not entry.get('model'):
+            log_message(f"LLM_PROVIDERS entry needs 'url' and 'model', skipping: {entry!r}")
+            continue
+        api_key = os.getenv(entry['api_key_env']) if entry.get('api_key_env') else None
+        if entry.get('api_key_env') and not api_key:
+            continue
+        providers.append({'name': entry.get('name') or urlparse(entry['url']).netloc, 'url': entry['url'],
+                          'model': entry['model'], 'api_key': api_key,
+                          'json_mode': entry.get('json_mode', True), 'extra': entry.get('extra', {})})
+    if os.getenv('LOCAL_LLM_URL'):
+        providers.append({'name': 'local', 'url': os.getenv('LOCAL_LLM_URL'),
+                          'model': os.getenv('LOCAL_LLM_MODEL', 'local'), 'api_key': None,
+                          'json_mode': os.getenv('LOCAL_LLM_JSON_MODE', '1') != '0', 'extra': {}})
+    if not providers:
+        # Keep the old behaviour (and its 401) visible rather than silently doing nothing
+        providers.append({'name': 'glm', 'url': GLM_API_URL, 'model': GLM_MODEL, 'api_key': GLM_API_KEY,
+                          'json_mode': True, 'extra': {'thinking': {'type': 'disabled'}}})
+    return providers
+
+LLM_PROVIDERS = load_llm_providers()
+_provider_stats = {}
+
+def provider_cost(provider):
+    stats = _provider_stats.get(provider['name'], {})
+    return stats.get('latency', LLM_UNKNOWN_LATENCY)
+
+def route_providers():
+    """Providers out of cool-down, cheapest observed latency first (config order breaks ties)"""
+    now = time.time()
+    available = [(i, p) for i, p in enumerate(LLM_PROVIDERS)
+                 if _provider_stats.get(p['name'], {}).get('cooldown_until', 0) <= now]
+    if not available:
+        # Everything is cooling down: try them all anyway rather than fail outright
+        available = list(enumerate(LLM_PROVIDERS))
+    return [p for _, p in sorted(available, key=lambda x: (provider_cost(x[1]), x[0]))]
+
+def record_provider_result(provider, ok, seconds=0.0, output_chars=0):
+    """Latency EWMA, normalized per ~1000 output chars, plus failure cool-down"""
+    stats = _provider_stats.setdefault(provider['name'], {'failures': 0})
+    if ok:
+        cost = seconds / (1 + output_chars / 1000)
+        stats['latency'] = cost if 'latency' not in stats else \
+            LLM_LATENCY_ALPHA * cost + (1 - LLM_LATENCY_ALPHA) * stats['latency']
+        stats['failures'] = 0
+        stats['cooldown_until'] = 0
+        return
+    stats['failures'] += 1
+    if stats['failures'] >= LLM_FAILURE_THRESHOLD:
+        cooldown = min(LLM_MAX_COOLDOWN, LLM_BASE_COOLDOWN * 2 ** (stats['failures'] - LLM_FAILURE_THRESHOLD))
+        stats['cooldown_until'] = time.time() + cooldown
+        log_message(f"  LLM provider {provider['name']} cooling down for {cooldown // 60:.0f} min")
+
+def build_glm_request(messages, max_tokens, temperature, json_mode=False, stream=False, provider=None):
+    provider = provider or LLM_PROVIDERS[0]
+    headers = {'Content-Type': 'application/json'}
+    if provider.get('api_key'):
+        headers['Authorization'] = f"Bearer {provider['api_key']}"
+    data = {
+        'model': provider['model'],
+        'messages': messages,
+        'max_tokens': max_tokens,
+        'temperature': temperature,
+        **provider.get('extra', {})
+    }
+    if json_mode and provider.get('json_mode'):
+        data['response_format'] = {'type': 'json_object'}
+    if stream:
+        data['stream'] = True
+    return headers, data
+
+def call_glm(messages, max_tokens, temperature, timeout, json_mode=False):
+    """Send one chat completion request, returns (content, finish_reason)
+    
+    Providers are tried in route_providers() order until one answers. Raises once all
+    of them fail, so callers keep their own retry policy. json_mode asks the endpoint
+    to constrain the reply to a single JSON object.
+    """
+    errors = []
+    for provider in route_providers():
+        if errors and deadline_exceeded():
+            break
+        headers, data = build_glm_request(messages, max_tokens, temperature, json_mode=json_mode, provider=provider)
+        started = time.time()
+        try:
+            response = get_http_session().post(provider['url'], headers=headers, json=data,
+                                               timeout=request_timeout(timeout))
+            if response.status_code != 200:
+                raise LLMAPIError(f"API error {response.status_code}")
+            result = response.json()
+            if not result.get('choices'):
+                raise LLMAPIError("API returned no choices")
+            choice = result['choices'][0]
+            content = choice['message']['content'] or ''
+        except Exception as e:
+            record_provider_result(provider, False)
+            errors.append(f"{provider['name']}: {e}")
+            continue
+        record_provider_result(provider, True, time.time() - started, len(content))
+        return content, choice.get('finish_reason')
+    raise LLMAPIError('; '.join(errors) or 'no LLM provider available')
+
+def stream_glm(messages, max_tokens, temperature, timeout):
+    """Stream a chat completion over SSE, yielding (content_delta, finish_reason) pairs
+    
+    timeout applies per read, so a long generation is fine as long as tokens keep arriving.
+    Fails over to the next provider only if the current one breaks before its first token.
+    """
+    errors = []
+    for provider in route_providers():
+        if errors and deadline_exceeded():
+            break
+        headers, data = build_glm_request(messages, max_tokens, temperature, stream=True, provider=provider)
+        started = time.time()
+        output_chars = 0
+        try:
+            with get_http_session().post(provider['url'], headers=headers, json=data,
+                                         timeout=request_timeout(timeout), stream=True) as response:
+                if response.status_code != 200:
+                    raise LLMAPIError(f"API error {response.status_code}")
+                response.encoding = 'utf-8'
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith('data:'):
+                        continue
+                    payload = line[5:].strip()
+                    if payload == '[DONE]':
+                        break
+                    try:
+                        chunk = json.loads(payload)
+                    except json.JSONDecodeError:
+                        continue
+                    choices = chunk.get('choices') or []
+                    if not choices:
+                        continue
+                    delta = (choices[0].get('delta') or {}).get('content') or ''
+                    output_chars += len(delta)
+                    yield delta, choices[0].get('finish_reason')
+        except Exception as e:
+            record_provider_result(provider, False)
+            if output_chars:
+                raise
+            errors.append(f"{provider['name']}: {e}")
+            continue
+        record_provider_result(provider, True, time.time() - started, output_chars)
+        return
+    raise LLMAPIError('; '.join(errors) or 'no LLM provider available')
+
+# ============================================================
+# Extractive Fallback Summarizer
+# ============================================================
+
+FALLBACK_SUMMARY_LINES = 4
+FALLBACK_LINE_CHARS = 60
+FALLBACK_PADDING = ['자세한 내용은 원문 기사 참조', '원문 링크에서 전체 내용 확인 가능', 'AI 업계 최신 소식', '관련 동향 업데이트 예정']
+
+def split_sentences(text):
+    text = re.sub(r'<[^>]+>', ' ', text or '')
+    text = re.sub(r'\s+', ' ', text).strip()
+    parts = re.split(r'(?<=[.!?。])\s+|(?<=다\.)|(?<=요\.)', text)
+    return [p.strip() for p in parts if len(p.strip()) >= 8]
+
+def extractive_summary(text, title='', lines=FALLBACK_SUMMARY_LINES):
+    """Four bullet lines picked from text by term-frequency sentence ranking, no LLM needed
+    
+    Sentences sharing many frequent terms with the text and its title score highest,
+    with a small bonus for appearing early. Short inputs are split into clauses and,
+    if still short, padded so the bullet format always holds.
+    """
+    from collections import Counter
+    sentences = split_sentences(text)
+    freq = Counter(tokenize_text(' '.join(sentences)))
+    title_terms = set(tokenize_text(title))
+    
+    scored = []
+    for i, sentence in enumerate(sentences):
+        terms = set(tokenize_text(sentence))
+        if not terms:
+            continue
+        score = sum(freq[t] for t in terms) / len(terms) ** 0.5 + 2 * len(terms & title_terms) + 1 / (1 + i)
+        scored.append((score, i, sentence))
+    picked = [sentence for _, _, sentence in sorted(sorted(scored, reverse=True)[:lines], key=lambda x: x[1])]
+    
+    if len(picked) < lines:
+        clauses = []
+        for sentence in picked or [re.sub(r'\s+', ' ', re.sub(r'<[^>]+>', ' ', text or '')).strip()]:
+            clauses.extend(c.strip() for c in re.split(r',\s+|·|;\s+', sentence) if len(c.strip()) >= 6)
+        if len(clauses) > len(picked):
+            picked = clauses[:lines]
+    
+    bullets = []
+    for sentence in picked:
+        sentence = sentence.rstrip('.。 ')
+        if len(sentence) > FALLBACK_LINE_CHARS:
+            sentence = sentence[:FALLBACK_LINE_CHARS - 1].rstrip() + '…'
+        if sentence and sentence not in bullets:
+            bullets.append(sentence)
+    for line in FALLBACK_PADDING:
+        if len(bullets) >= lines:
+            break
+        bullets.append(line)
+    return bullets[:lines]
+
+def fallback_summary(article):
+    """'• '-joined extractive summary of an article's description"""
+    lines = extractive_summary(article.get('description', ''), article.get('title', ''))
+    return '\n'.join(f'• {line}' for line in lines)
+
 # ============================================================
 # HuggingFace Trending Models Pipeline
 # ============================================================
 
+HF_MODELS_STATE_PATH = 'hf_models.json'
+HF_EXPAND_FIELDS = ('cardData', 'siblings', 'lastModified', 'sha', 'gated',
+                    'pipeline_tag', 'tags', 'downloads', 'likes')
+HF_IMAGE_SIBLING = re.compile(r'^(?:assets/|images?/|figures?/)?[^/]*(thumbnail|banner|cover|logo|teaser)[^/]*\.(png|jpe?g|webp|gif)$', re.IGNORECASE)
+
 def fetch_huggingface_trending(limit=20):
-    """Fetch trending models from HuggingFace REST API"""
+    """Fetch trending models from HuggingFace REST API
+    
+    The listing asks for the expanded metadata (card data, file list, revision sha,
+    gating) so plan_model_fetches can decide which models need a README at all.
+    """
     url = 'https://huggingface.co/api/models'
-    params = {'sort': 'trendingScore', 'direction': '-1', 'limit': limit}
+    params = [('sort', 'trendingScore'), ('direction', '-1'), ('limit', limit)]
+    params += [('expand[]', field) for field in HF_EXPAND_FIELDS]
     headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
     
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        response = hedged_get(url, 30, params=params, headers=headers)
         if response.status_code == 200:
             models = response.json()
             log_message(f"  HuggingFace API: Fetched {len(models)} trending models")
@@ -175,40 +675,95 @@ def fetch_huggingface_trending(limit=20):
         log_message(f"  HuggingFace API exception: {e}")
         return []
 
+README_TEXT_CHARS = 3000                 # README body handed to the summarizer
+README_SCAN_BYTES = 64 * 1024            # how far into a README to look for an image
+README_BADGE_HINTS = ('shields.io', 'badge', 'badgen.net', '/actions/workflows/', 'colab.research.google.com/assets')
+README_IMAGE_PATTERN = re.compile(r'!\[[^\]]*\]\(\s*<?([^)\s>]+)|<img[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE)
+
+def resolve_readme_image(model_id, img_src):
+    """Absolute URL for a README image, or None for data: URIs and badges"""
+    if img_src.startswith('data:') or any(hint in img_src.lower() for hint in README_BADGE_HINTS):
+        return None
+    if img_src.startswith('http'):
+        # blob/ links render an HTML page; resolve/ serves the file itself
+        return re.sub(r'^(https://huggingface\.co/[^?#]+?)/blob/', r'\1/resolve/', img_src)
+    path = re.sub(r'^(\./|/)+', '', img_src)
+    return f"https://huggingface.co/{model_id}/resolve/main/{path}"
+
+def read_readme_stream(response, model_id):
+    """Single bounded pass over a streamed README: (body text, first real image URL)
+    
+    YAML front-matter is skipped before the text budget is counted. Reading stops
+    as soon as the body text is full and an image was found, or after README_SCAN_BYTES.
+    """
+    import codecs
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    raw_bytes = 0
+    buffer = ''
+    body = None                          # None while still inside possible front-matter
+    scan_from = 0
+    image_url = None
+    
+    for chunk in response.iter_content(8192):
+        raw_bytes += len(chunk)
+        buffer += decoder.decode(chunk)
+        
+        if body is None:
+            if not buffer.lstrip('\ufeff').startswith('---'):
+                body = buffer
+            else:
+                end = re.search(r'\n---[ \t]*\r?\n', buffer[3:])
+                if end is None and raw_bytes < README_SCAN_BYTES:
+                    continue
+                body = buffer[3 + end.end():] if end else ''
+            buffer = ''
+        else:
+            body += buffer
+            buffer = ''
+        
+        while image_url is None:
+            match = README_IMAGE_PATTERN.search(body, scan_from)
+            # A match touching the end of the buffer may still be cut off
+            if not match or match.end() >= len(body):
+                scan_from = max(scan_from, len(body) - 512)
+                break
+            scan_from = match.end()
+            image_url = resolve_readme_image(model_id, match.group(1) or match.group(2))
+        
+        if (image_url and len(body) >= README_TEXT_CHARS) or raw_bytes >= README_SCAN_BYTES:
+            break
+    response.close()
+    
+    if body is None:
+        body = buffer
+    if image_url is None:
+        for match in README_IMAGE_PATTERN.finditer(body, scan_from):
+            image_url = resolve_readme_image(model_id, match.group(1) or match.group(2))
+            if image_url:
+                break
+    return body.strip()[:README_TEXT_CHARS], image_url
+
 def fetch_model_readme_and_image(model_id, model_data=None):
     """Fetch README.md content and extract first image from a HuggingFace model"""
     readme_url = f"https://huggingface.co/{model_id}/raw/main/README.md"
-    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
+        'Range': f'bytes=0-{README_SCAN_BYTES - 1}'
+    }
     
     readme_text = ""
     image_url = None
     
     try:
-        response = requests.get(readme_url, headers=headers, timeout=15)
-        if response.status_code == 200:
-            readme_text = response.text[:3000]  # Limit to first 3000 chars
-            
-            # Extract first image from markdown
-            # Pattern 1: ![alt](url)
-            img_match = re.search(r'!\[[^\]]*\]\(([^)]+)\)', readme_text)
-            if img_match:
-                img_src = img_match.group(1)
-                # Convert relative URLs to absolute
-                if img_src.startswith('http'):
-                    image_url = img_src
-                elif not img_src.startswith('data:'):
-                    image_url = f"https://huggingface.co/{model_id}/resolve/main/{img_src}"
-            
-            # Pattern 2: <img src="...">
-            if not image_url:
-                img_tag_match = re.search(r'<img[^>]+src=["\']([^"\']+)["\']', readme_text)
-                if img_tag_match:
-                    img_src = img_tag_match.group(1)
-                    if img_src.startswith('http'):
-                        image_url = img_src
-                    elif not img_src.startswith('data:'):
-                        image_url = f"https://huggingface.co/{model_id}/resolve/main/{img_src}"
-        elif response.status_code in [401, 403] and model_data:
+        response = hedged_get(readme_url, 15, headers=headers, stream=True)
+        if response.status_code in (200, 206):
+            try:
+                readme_text, image_url = read_readme_stream(response, model_id)
+            finally:
+                response.close()
+        else:
+            response.close()
+        if response.status_code in [401, 403] and model_data:
             # Gated model - build description from API data
             tags = model_data.get('tags', [])
             pipeline_tag = model_data.get('pipeline_tag', '')
@@ -226,8 +781,78 @@ def fetch_model_readme_and_image(model_id, model_data=None):
     
     return readme_text, image_url
 
+def load_hf_models_state(path=HF_MODELS_STATE_PATH):
+    try:
+        with open(path, 'rb') as f:
+            return json_loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_hf_models_state(state, path=HF_MODELS_STATE_PATH):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json_dumps(state))
+
+def model_sibling_image(model_id, model):
+    """A thumbnail/banner-like image listed in the repo files, if any"""
+    for sibling in model.get('siblings') or []:
+        name = sibling.get('rfilename', '')
+        if HF_IMAGE_SIBLING.match(name):
+            return f"https://huggingface.co/{model_id}/resolve/main/{name}"
+    return None
+
+def model_metadata_text(model_id, model):
+    """Summarizer input built from listing metadata, for models whose README is not fetched"""
+    card = model.get('cardData') or {}
+    tags = model.get('tags', [])
+    tag_str = ', '.join([t for t in tags if not t.startswith('license') and ':' not in t][:5])
+    lines = [
+        f"Model: {model_id}",
+        f"Pipeline: {model.get('pipeline_tag') or card.get('pipeline_tag', '')}",
+        f"Tags: {tag_str}",
+        f"Downloads: {model.get('downloads', 0):,}",
+        f"Likes: {model.get('likes', 0)}"
+    ]
+    for key in ('base_model', 'license', 'language', 'datasets', 'library_name'):
+        value = card.get(key)
+        if value:
+            lines.append(f"{key}: {', '.join(map(str, value[:5])) if isinstance(value, list) else value}")
+    return '\n'.join(lines)
+
+def plan_model_fetches(models, existing_models_cache, state):
+    """Decide per model: 'reuse' the stored entry, 'metadata' only, or fetch the 'readme'
+    
+    A cached model is reused while its revision sha is unchanged, unless its stored
+    summary was a fallback marked for retry. Gated models and
+    models without a README.md are summarized from listing metadata, skipping the
+    README round-trip that would fail or return nothing.
+    """
+    plan = []
+    for model in models:
+        model_id = model.get('modelId') or model.get('id', '')
+        if not model_id:
+            continue
+        link = f'https://huggingface.co/{model_id}'
+        known = state.get(model_id, {})
+        known_sha = known.get('sha')
+        siblings = model.get('siblings')
+        
+        if link in existing_models_cache and not known.get('retry') and (not known_sha or not model.get('sha') or known_sha == model['sha']):
+            action = 'reuse'
+        elif model.get('gated'):
+            action = 'metadata'
+        elif siblings is not None and not any(s.get('rfilename') == 'README.md' for s in siblings):
+            action = 'metadata'
+        else:
+            action = 'readme'
+        plan.append((model_id, model, action))
+    return plan
+
 def summarize_model_with_glm(model_id, readme_text):
-    """Generate 4-line summary for a HuggingFace model using GLM API"""
+    """Generate 4-line summary for a HuggingFace model using GLM API
+    
+    Returns (summary_lines, used_fallback); used_fallback is True whenever the lines
+    did not come from the model, so the caller can retry it on the next run.
+    """
     if not readme_text or len(readme_text.strip()) < 50:
         model_name = model_id.split('/')[-1]
         return [
@@ -235,13 +860,7 @@ def summarize_model_with_glm(model_id, readme_text):
             "HuggingFace에서 트렌딩 중",
             "다운로드 및 상세 정보는 링크에서",
             "최신 오픈소스 AI 기술"
-        ]
-    
-    url = "https://api.z.ai/api/coding/paas/v4/chat/completions"
-    headers = {
-        'Authorization': f'Bearer {GLM_API_KEY}',
-        'Content-Type': 'application/json'
-    }
+        ], True
     
     prompt = f"""다음은 HuggingFace 모델 '{model_id}'의 README 문서입니다:
 
@@ -256,48 +875,33 @@ def summarize_model_with_glm(model_id, readme_text):
 - 이모지 사용 금지
 - 반드시 한국어로 작성"""
 
-    data = {
-        'model': 'glm-4.7',
-        'messages': [
-            {'role': 'system', 'content': '너는 IT 트렌드 뉴스 에디터야. 기술 문서를 간결한 뉴스 형식으로 요약하는 전문가야.'},
-            {'role': 'user', 'content': prompt}
-        ],
-        'max_tokens': 500,
-        'temperature': 0.5,
-        'thinking': {'type': 'disabled'}
-    }
+    messages = [
+        {'role': 'system', 'content': '너는 IT 트렌드 뉴스 에디터야. 기술 문서를 간결한 뉴스 형식으로 요약하는 전문가야.'},
+        {'role': 'user', 'content': prompt}
+    ]
     
-    try:
-        response = requests.post(url, headers=headers, json=data, timeout=60)
-        if response.status_code == 200:
-            result = response.json()
-            if 'choices' in result and len(result['choices']) > 0:
-                content = result['choices'][0]['message']['content'].strip()
-                
-                # Parse JSON response
-                json_match = re.search(r'\{[^{}]*"summary"[^{}]*\}', content, re.DOTALL)
-                if json_match:
-                    try:
-                        parsed = json.loads(json_match.group())
-                        if 'summary' in parsed and isinstance(parsed['summary'], list):
-                            return parsed['summary'][:4]
-                    except json.JSONDecodeError:
-                        pass
-                
-                # Fallback: extract bullet points or lines
-                lines = [l.strip() for l in content.split('\n') if l.strip() and not l.startswith('{')]
-                if len(lines) >= 4:
-                    return lines[:4]
-    except Exception as e:
-        log_message(f"    GLM API error for {model_id}: {e}")
+    # One retry when the reply fails the schema check
+    for attempt in range(2):
+        try:
+            content, _ = call_glm(messages, max_tokens=500, temperature=0.5, timeout=60, json_mode=True)
+            parsed = parse_json_object(content)
+            summary = validate_summary_lines(parsed.get('summary')) if parsed else None
+            if summary:
+                return summary, False
+            log_message(f"    Invalid summary JSON for {model_id} (Attempt {attempt+1}/2)")
+        except Exception as e:
+            log_message(f"    GLM API error for {model_id}: {e}")
+            break
     
-    # Default fallback
+    # Default fallback: extract from the README when there is one
+    if len(readme_text.strip()) >= 200:
+        return extractive_summary(re.sub(r'[#*`>|\[\]()!]', ' ', readme_text), model_id), True
     return [
         f"{model_id.split('/')[-1]} 모델 공개",
         "HuggingFace 트렌딩 모델",
         "최신 AI 기술 적용",
         "상세 정보는 링크 참조"
-    ]
+    ], True
 
 def process_huggingface_models(existing_models_cache=None):
     """Main pipeline: Fetch trending models, get README, summarize with GLM
@@ -319,33 +923,43 @@ def process_huggingface_models(existing_models_cache=None):
     processed_models = []
     reused_count = 0
     new_count = 0
+    state = load_hf_models_state()
+    plan = plan_model_fetches(models, existing_models_cache, state)
     
-    for i, model in enumerate(models):
-        model_id = model.get('modelId', '')
-        if not model_id:
-            continue
-        
+    for i, (model_id, model, action) in enumerate(plan):
         model_link = f'https://huggingface.co/{model_id}'
+        state[model_id] = {'sha': model.get('sha'), 'lastModified': model.get('lastModified'), 'seen': today}
         
-        if model_link in existing_models_cache:
+        if action == 'reuse':
             cached = existing_models_cache[model_link]
             cached['date'] = today
             processed_models.append(cached)
-            log_message(f"  [{i+1}/{len(models)}] Reusing cached: {model_id}")
+            log_message(f"  [{i+1}/{len(plan)}] Reusing cached: {model_id}")
             reused_count += 1
             continue
         
-        log_message(f"  [{i+1}/{len(models)}] Processing new: {model_id}")
-        
-        readme_text, image_url = fetch_model_readme_and_image(model_id, model)
+        image_url = None
+        if deadline_exceeded():
+            # Out of budget: ship the model with fallback summary/image instead of blocking
+            log_message(f"  [{i+1}/{len(plan)}] Budget exhausted, using fallback for: {model_id}")
+            readme_text = ''
+        elif action == 'metadata':
+            log_message(f"  [{i+1}/{len(plan)}] Processing from metadata ({'gated' if model.get('gated') else 'no README'}): {model_id}")
+            readme_text = model_metadata_text(model_id, model)
+        else:
+            log_message(f"  [{i+1}/{len(plan)}] Processing new: {model_id}")
+            readme_text, image_url = fetch_model_readme_and_image(model_id, model)
         
         if not image_url or 'thumbnail.png' in image_url:
-            image_url = HUGGINGFACE_DEFAULT_IMAGES[i % len(HUGGINGFACE_DEFAULT_IMAGES)]
+            image_url = model_sibling_image(model_id, model) or HUGGINGFACE_DEFAULT_IMAGES[i % len(HUGGINGFACE_DEFAULT_IMAGES)]
         
-        summary_list = summarize_model_with_glm(model_id, readme_text)
+        summary_list, used_fallback = summarize_model_with_glm(model_id, readme_text)
+        if used_fallback:
+            # Fallback summary: fetch this revision again on the next run
+            state[model_id]['retry'] = True
         summary_text = '\n'.join([f'• {s}' for s in summary_list])
         
-        model_data = {
+        model_data = Article({
             'title': model_id,
             'link': f'https://huggingface.co/{model_id}',
             'date': today,
@@ -357,11 +971,15 @@ def process_huggingface_models(existing_models_cache=None):
             'translated_title': model_id,
             'category_keyword': 'AI Model',
             'category': 'AI Model'
-        }
+        })
         
         processed_models.append(model_data)
         new_count += 1
-        time.sleep(1)
+        if not deadline_exceeded():
+            time.sleep(1)
+    
+    cutoff = (get_kst_now() - timedelta(days=30)).strftime('%Y-%m-%d')
+    save_hf_models_state({k: v for k, v in state.items() if v.get('seen', '') >= cutoff})
     
     log_message(f"  Total: {len(processed_models)} models (new: {new_count}, cached: {reused_count})")
     return processed_models
@@ -386,11 +1004,14 @@ def get_og_image(html_content):
 
 def fetch_article_image(article_url, rss_image=None):
     """Fetch og:image from article URL"""
+    if deadline_exceeded():
+        return rss_image
+    
     try:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        response = requests.get(article_url, headers=headers, timeout=10)
+        response = hedged_get(article_url, 10, headers=headers)
         if response.status_code == 200:
             og_image = get_og_image(response.text)
             if og_image:
@@ -400,59 +1021,509 @@ def fetch_article_image(article_url, rss_image=None):
     
     return rss_image
 
-def parse_rss_date(date_str, source):
-    """Parse RSS date to YYYY-MM-DD format with timezone conversion"""
-    date_formats = [
-        '%a, %d %b %Y %H:%M:%S %Z',
-        '%a, %d %b %Y %H:%M:%S %z',  # Added for Yonhap (+0900)
-        '%Y-%m-%dT%H:%M:%SZ',
-        '%Y-%m-%dT%H:%M:%S%z',
-        '%d %b %Y %H:%M:%S',
-        '%Y-%m-%d %H:%M:%S'
-    ]
+# ============================================================
+# Image Probing (dead-link and oversize pruning)
+# ============================================================
+
+IMAGE_PROBE_CACHE_PATH = 'image_probe.json'
+IMAGE_PROBE_WORKERS = 8
+IMAGE_PROBE_BYTES = 32 * 1024            # enough of the file to read its dimensions
+IMAGE_MAX_BYTES = int(os.getenv('IMAGE_MAX_BYTES', 3 * 1024 * 1024))
+IMAGE_MIN_SIDE = 64                      # smaller than this is a tracking pixel or icon
+IMAGE_PROBE_TTL = 7 * 24 * 60 * 60       # re-check good images weekly
+IMAGE_RETRY_TTL = 6 * 60 * 60            # re-check failures after roughly two runs
+IMAGE_DEAD_FAILURES = 2                  # consecutive failed probes before swapping
+
+def image_dimensions(data):
+    """(width, height) from the first bytes of a PNG, GIF, WebP or JPEG, else (None, None)"""
+    import struct
+    try:
+        if data[:8] == b'\x89PNG\r\n\x1a\n':
+            return struct.unpack('>II', data[16:24])
+        if data[:4] == b'GIF8':
+            return struct.unpack('<HH', data[6:10])
+        if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+            chunk = data[12:16]
+            if chunk == b'VP8 ':
+                width, height = struct.unpack('<HH', data[26:30])
+                return width & 0x3fff, height & 0x3fff
+            if chunk == b'VP8L':
+                bits = int.from_bytes(data[21:25], 'little')
+                return (bits & 0x3fff) + 1, ((bits >> 14) & 0x3fff) + 1
+            if chunk == b'VP8X':
+                return int.from_bytes(data[24:27], 'little') + 1, int.from_bytes(data[27:30], 'little') + 1
+        if data[:2] == b'\xff\xd8':
+            i = 2
+            while i + 9 < len(data):
+                if data[i] != 0xff:
+                    i += 1
+                    continue
+                marker = data[i + 1]
+                if marker == 0xff:
+                    i += 1
+                    continue
+                if marker in (0xd8, 0x01) or 0xd0 <= marker <= 0xd7:
+                    i += 2
+                    continue
+                if 0xc0 <= marker <= 0xcf and marker not in (0xc4, 0xc8, 0xcc):
+                    height, width = struct.unpack('>HH', data[i + 5:i + 9])
+                    return width, height
+                i += 2 + struct.unpack('>H', data[i + 2:i + 4])[0]
+    except struct.error:
+        pass
+    return None, None
+
+def probe_image(url, previous=None):
+    """Status, content-type, byte size and dimensions of an image URL
     
-    for fmt in date_formats:
-        try:
-            dt = datetime.strptime(date_str.strip(), fmt)
-            
-            # Convert GMT/UTC to KST (UTC+9)
-            tz_str = date_str.strip().split()[-1] if date_str else ''
-            if tz_str in ['GMT', 'UTC'] or fmt.endswith('Z'):
-                dt = dt + timedelta(hours=9)
-            
-            return dt.strftime('%Y-%m-%d')
-        except:
-            continue
+    Images whose dimensions are already known are re-validated with a HEAD request;
+    otherwise, or when the host refuses HEAD, a ranged GET reads just the header bytes.
+    """
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
+    record = {'checked': int(time.time()), 'failures': 0}
+    session = get_http_session()
+    try:
+        response = None
+        if previous and previous.get('width'):
+            response = session.head(url, headers=headers, timeout=request_timeout(8), allow_redirects=True)
+            data = b''
+            if response.status_code in (403, 405, 501):
+                response = None
+        if response is None:
+            response = session.get(url, headers={**headers, 'Range': f'bytes=0-{IMAGE_PROBE_BYTES - 1}'},
+                                   timeout=request_timeout(8), stream=True)
+            data = b''
+            if response.status_code in (200, 206):
+                for chunk in response.iter_content(8192):
+                    data += chunk
+                    if len(data) >= IMAGE_PROBE_BYTES:
+                        break
+            response.close()
+        
+        record['status'] = response.status_code
+        record['content_type'] = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        content_range = response.headers.get('Content-Range', '')
+        if '/' in content_range and content_range.rsplit('/', 1)[1].isdigit():
+            record['bytes'] = int(content_range.rsplit('/', 1)[1])
+        elif response.status_code == 200 and response.headers.get('Content-Length', '').isdigit():
+            record['bytes'] = int(response.headers['Content-Length'])
+        
+        if data:
+            record['width'], record['height'] = image_dimensions(data)
+        elif previous:
+            record['width'], record['height'] = previous.get('width'), previous.get('height')
+    except Exception as e:
+        record['error'] = type(e).__name__
     
-    # If parsing fails, return None instead of today's date to avoid duplicates
+    if record.get('error') or record.get('status') not in (200, 206):
+        record['failures'] = (previous or {}).get('failures', 0) + 1
+    return record
+
+def image_problem(record):
+    """Why an image should be replaced, or None when it is fine to keep"""
+    status = record.get('status')
+    if record.get('error') or status not in (200, 206):
+        # CDNs often refuse a bot once (403/404/429/5xx); only repeated failures count
+        if record.get('failures', 0) < IMAGE_DEAD_FAILURES:
+            return None
+        return f'http {status}' if status else 'unreachable'
+    content_type = record.get('content_type')
+    if content_type and not content_type.startswith('image/'):
+        return f'not an image ({content_type})'
+    if record.get('bytes') and record['bytes'] > IMAGE_MAX_BYTES:
+        return f"oversized ({record['bytes'] // 1024} KB)"
+    if record.get('width') and record.get('height') and min(record['width'], record['height']) < IMAGE_MIN_SIDE:
+        return f"too small ({record['width']}x{record['height']})"
     return None
 
-def fetch_rss_news(source_info, target_date, include_yesterday=False):
-    """Fetch news from RSS source for a specific date (optionally include yesterday)"""
-    # Simple headers often work better for RSS feeds
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
-        'Accept': 'application/rss+xml, application/xml, text/xml, */*'
-    }
+def probe_due(record, now):
+    if record is None:
+        return True
+    ttl = IMAGE_RETRY_TTL if record.get('failures') or record.get('error') else IMAGE_PROBE_TTL
+    return now - record.get('checked', 0) >= ttl
+
+def load_image_probes(path=IMAGE_PROBE_CACHE_PATH):
+    try:
+        with open(path, 'rb') as f:
+            return json_loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_image_probes(probes, path=IMAGE_PROBE_CACHE_PATH):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json_dumps(probes))
+
+def replacement_image(news):
+    pool = HUGGINGFACE_DEFAULT_IMAGES if news.get('category') == 'AI Model' else DEFAULT_IMAGES
+    return pool[int(article_id(news.get('link', '')), 16) % len(pool)]
+
+def validate_images(existing_dates, window=10):
+    """Probe every image in the window (cached) and swap dead or oversized ones for defaults
+    
+    A swapped-out URL is kept as 'original_image' and probed again on later runs, so an
+    image that recovers is restored.
+    """
+    from concurrent.futures import ThreadPoolExecutor
     
+    dates = sorted(existing_dates.values(), key=lambda x: x['date'], reverse=True)[:window]
+    known_good = set(DEFAULT_IMAGES) | set(HUGGINGFACE_DEFAULT_IMAGES)
+    source = lambda news: news.get('original_image') or news.get('image') or ''
+    items = [news for d in dates for news in d.get('news', [])
+             if source(news).startswith('http') and source(news) not in known_good]
+    
+    probes = load_image_probes()
+    now = time.time()
+    due = sorted({source(news) for news in items if probe_due(probes.get(source(news)), now)})
+    if due and not deadline_exceeded():
+        with ThreadPoolExecutor(max_workers=IMAGE_PROBE_WORKERS) as executor:
+            futures = {url: executor.submit(probe_image, url, probes.get(url)) for url in due}
+            for url, future in futures.items():
+                probes[url] = future.result()
+    
+    replaced = 0
+    restored = 0
+    for news in items:
+        url = source(news)
+        problem = image_problem(probes.get(url, {}))
+        if problem and not news.get('original_image'):
+            log_message(f"    Image replaced ({problem}): {url[:80]}")
+            news['original_image'] = url
+            news['image'] = replacement_image(news)
+            replaced += 1
+        elif not problem and news.get('original_image'):
+            log_message(f"    Image restored: {url[:80]}")
+            news['image'] = news.pop('original_image')
+            restored += 1
+    
+    in_use = {source(news) for news in items}
+    stale = now - 30 * 24 * 60 * 60
+    probes = {url: rec for url, rec in probes.items() if url in in_use or rec.get('checked', 0) >= stale}
+    save_image_probes(probes)
+    log_message(f"  Images: {len(due)} probed, {len(items) - len(due)} cached, {replaced} replaced, {restored} restored")
+
+# ============================================================
+# Image Mirror (optional, content-hashed WebP/AVIF copies)
+# ============================================================
+
+IMAGE_MIRROR = os.getenv('IMAGE_MIRROR', '0') == '1'
+MIRROR_DIR = 'media'
+MIRROR_INDEX_PATH = os.path.join(MIRROR_DIR, 'index.json')
+MIRROR_WIDTHS = (480, 828)               # phone widths at 1x/2x for a 414px reel
+MIRROR_WEBP_QUALITY = 75
+MIRROR_AVIF_QUALITY = 50
+MIRROR_WORKERS = 8
+
+def mirror_path(digest, width, ext):
+    return f'{MIRROR_DIR}/{digest}-{width}.{ext}'
+
+def transcode_image(job):
+    """Process-pool worker: write WebP (and AVIF when Pillow can encode it) at each mirror width
+    
+    Returns the preferred extension, or None when the image cannot be decoded.
+    """
+    from io import BytesIO
+    from PIL import Image
+    
+    digest, content = job
     try:
-        response = requests.get(source_info['url'], headers=headers, timeout=30)
-        
-        if response.status_code != 200:
-            log_message(f"  HTTP {response.status_code}: {source_info['name']}")
-            return []
+        image = Image.open(BytesIO(content))
+        image.load()
+    except Exception:
+        return digest, None
+    image = image.convert('RGBA' if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+    
+    ext = 'avif'
+    for width in MIRROR_WIDTHS:
+        target = min(width, image.width)
+        resized = image if target == image.width else image.resize(
+            (target, max(1, round(image.height * target / image.width))), Image.LANCZOS)
+        resized.save(mirror_path(digest, width, 'webp'), 'WEBP', quality=MIRROR_WEBP_QUALITY, method=4)
+        if ext == 'avif':
+            try:
+                resized.save(mirror_path(digest, width, 'avif'), 'AVIF', quality=MIRROR_AVIF_QUALITY)
+            except Exception:
+                ext = 'webp'
+    if ext == 'webp':
+        for width in MIRROR_WIDTHS:
+            if os.path.exists(mirror_path(digest, width, 'avif')):
+                os.remove(mirror_path(digest, width, 'avif'))
+    return digest, ext
+
+def download_image(url):
+    """Image bytes up to IMAGE_MAX_BYTES, or None"""
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
+    try:
+        response = get_http_session().get(url, headers=headers, timeout=request_timeout(15), stream=True)
+        if response.status_code != 200:
+            response.close()
+            return None
+        content = b''
+        for chunk in response.iter_content(65536):
+            content += chunk
+            if len(content) > IMAGE_MAX_BYTES:
+                response.close()
+                return None
+        return content
+    except Exception:
+        return None
+
+def mirror_images(existing_dates, window=10):
+    """Mirror every remote image in the window and point 'image' at the local copy
+    
+    Images are deduplicated by content hash, so the default images shared by hundreds
+    of articles are stored once. Transcoding runs in a process pool and is skipped for
+    hashes that are already on disk.
+    """
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        log_message("  Image mirror skipped: Pillow is not installed")
+        return
+    
+    os.makedirs(MIRROR_DIR, exist_ok=True)
+    try:
+        with open(MIRROR_INDEX_PATH, 'rb') as f:
+            index = json_loads(f.read())
+    except (FileNotFoundError, ValueError):
+        index = {}
+    
+    dates = sorted(existing_dates.values(), key=lambda x: x['date'], reverse=True)[:window]
+    items = [news for d in dates for news in d.get('news', []) if (news.get('image') or '').startswith('http')]
+    urls = sorted({news['image'] for news in items if news['image'] not in index})
+    # Already rewritten to a local copy in an earlier run: still in use, keep it alive
+    local_hashes = {os.path.basename(news['image']).split('-')[0] for d in dates for news in d.get('news', [])
+                    if (news.get('image') or '').lstrip('/').startswith(f'{MIRROR_DIR}/')}
+    
+    downloaded = {}
+    if urls and not deadline_exceeded():
+        with ThreadPoolExecutor(max_workers=MIRROR_WORKERS) as executor:
+            for url, content in zip(urls, executor.map(download_image, urls)):
+                if content:
+                    downloaded[url] = content
+    
+    known = {entry['hash']: entry['ext'] for entry in index.values()}
+    jobs = {}
+    for url, content in downloaded.items():
+        digest = hashlib.sha256(content).hexdigest()[:16]
+        if digest not in known and digest not in jobs:
+            jobs[digest] = content
+    
+    if jobs:
+        with ProcessPoolExecutor() as executor:
+            for digest, ext in executor.map(transcode_image, jobs.items()):
+                if ext:
+                    known[digest] = ext
+    
+    today = get_kst_today()
+    for url, content in downloaded.items():
+        digest = hashlib.sha256(content).hexdigest()[:16]
+        if digest in known:
+            index[url] = {'hash': digest, 'ext': known[digest], 'used': today}
+    
+    for entry in index.values():
+        if entry['hash'] in local_hashes:
+            entry['used'] = today
+    
+    rewritten = 0
+    for news in items:
+        entry = index.get(news['image'])
+        if entry:
+            entry['used'] = today
+            news['image'] = mirror_path(entry['hash'], MIRROR_WIDTHS[-1], entry['ext'])
+            rewritten += 1
+    
+    cutoff = (get_kst_now() - timedelta(days=max(ARCHIVE_RETENTION_DAYS, window))).strftime('%Y-%m-%d')
+    index = {url: entry for url, entry in index.items() if entry.get('used', '') >= cutoff}
+    live = {entry['hash'] for entry in index.values()}
+    for name in os.listdir(MIRROR_DIR):
+        if name != 'index.json' and name.split('-')[0] not in live:
+            os.remove(os.path.join(MIRROR_DIR, name))
+    
+    with open(MIRROR_INDEX_PATH, 'w', encoding='utf-8') as f:
+        f.write(json_dumps(index))
+    log_message(f"  Mirror: {len(downloaded)} downloaded, {len(jobs)} transcoded, {rewritten} image(s) rewritten")
+
+# ============================================================
+# Feed Health & Circuit Breaker
+# ============================================================
+
+FEED_HEALTH_PATH = 'feed_health.json'
+FEED_DEFAULT_TIMEOUT = 30
+FEED_MIN_TIMEOUT = 8
+HEALTH_EWMA_ALPHA = 0.3
+CIRCUIT_FAILURE_THRESHOLD = 3            # consecutive failures before the circuit opens
+CIRCUIT_BASE_COOLDOWN = 30 * 60          # doubles with every further failure
+CIRCUIT_MAX_COOLDOWN = 24 * 60 * 60
+LOW_YIELD_THRESHOLD = 1.0                # new articles per fetch below which a feed is down-weighted
+LOW_YIELD_BACKOFF = 3 * 60 * 60          # one cron period; scaled by how low the yield is
+LOW_YIELD_MIN_FETCHES = 5                # don't judge a feed on too little history
+
+def load_feed_health(path=FEED_HEALTH_PATH):
+    try:
+        with open(path, 'rb') as f:
+            return json_loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_feed_health(health, path=FEED_HEALTH_PATH):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json_dumps(health, pretty=True))
+
+def get_feed_state(health, name):
+    """Health record for one feed, created with neutral defaults"""
+    if health is None:
+        return {}
+    return health.setdefault(name, {
+        'latency_ms': 0,
+        'error_rate': 0.0,
+        'yield': None,
+        'fetches': 0,
+        'failures': 0,
+        'parse_failures': 0,
+        'consecutive_failures': 0,
+        'open_until': 0,
+        'last_fetch': 0,
+        'last_error': ''
+    })
+
+def ewma(previous, value):
+    if previous is None:
+        return value
+    return round(HEALTH_EWMA_ALPHA * value + (1 - HEALTH_EWMA_ALPHA) * previous, 3)
+
+def record_feed_result(health, name, latency, ok, parse_failed=False, error=''):
+    """Update latency/error statistics after a fetch and open the circuit on repeated failures"""
+    if health is None:
+        return
+    state = get_feed_state(health, name)
+    now = time.time()
+    state['fetches'] += 1
+    state['last_fetch'] = int(now)
+    state['latency_ms'] = int(ewma(state['latency_ms'] or None, latency * 1000))
+    state['error_rate'] = ewma(state['error_rate'], 0.0 if ok else 1.0)
+    
+    if ok:
+        state['consecutive_failures'] = 0
+        state['open_until'] = 0
+        return
+    
+    state['failures'] += 1
+    state['parse_failures'] += 1 if parse_failed else 0
+    state['consecutive_failures'] += 1
+    state['last_error'] = error[:200]
+    if state['consecutive_failures'] >= CIRCUIT_FAILURE_THRESHOLD:
+        cooldown = min(CIRCUIT_MAX_COOLDOWN,
+                       CIRCUIT_BASE_COOLDOWN * 2 ** (state['consecutive_failures'] - CIRCUIT_FAILURE_THRESHOLD))
+        state['open_until'] = int(now + cooldown)
+        log_message(f"  Circuit open for {name}: {state['consecutive_failures']} failures, "
+                    f"cooling down {int(cooldown // 60)} min")
+
+def record_feed_yield(health, name, new_count):
+    """Fold a fetch's new-article count into the yield average
+    
+    Skipped when the fetch just failed: record_feed_result already counted it, and a
+    zero yield on top would penalise the feed twice.
+    """
+    if health is None:
+        return
+    state = get_feed_state(health, name)
+    if state['consecutive_failures']:
+        return
+    state['yield'] = ewma(state['yield'], new_count)
+
+def feed_weight(state):
+    """1.0 for productive feeds, down to 0.25 for feeds that rarely yield anything new"""
+    if not state or state.get('fetches', 0) < LOW_YIELD_MIN_FETCHES or state.get('yield') is None:
+        return 1.0
+    return max(0.25, min(1.0, state['yield'] / LOW_YIELD_THRESHOLD))
+
+def feed_timeout(state):
+    """Low-yield and historically fast feeds get a shorter timeout"""
+    timeout = FEED_DEFAULT_TIMEOUT * feed_weight(state)
+    if state and state.get('latency_ms') and state.get('error_rate', 1) < 0.5:
+        timeout = min(timeout, max(FEED_MIN_TIMEOUT, 4 * state['latency_ms'] / 1000))
+    return max(FEED_MIN_TIMEOUT, timeout)
+
+def feed_skip_reason(state, now=None):
+    """Why a feed should not be fetched right now, or None when it is due"""
+    if not state:
+        return None
+    now = now or time.time()
+    if state.get('open_until', 0) > now:
+        return f"circuit open for {int((state['open_until'] - now) // 60)} more min"
+    weight = feed_weight(state)
+    if weight < 1.0 and now - state.get('last_fetch', 0) < LOW_YIELD_BACKOFF * (1 / weight - 1):
+        return f"low yield ({state['yield']}/fetch), skipped this round"
+    return None
+
+def parse_rss_date(date_str, source):
+    """Parse RSS date to YYYY-MM-DD format with timezone conversion"""
+    date_formats = [
+        '%a, %d %b %Y %H:%M:%S %Z',
+        '%a, %d %b %Y %H:%M:%S %z',  # Added for Yonhap (+0900)
+        '%Y-%m-%dT%H:%M:%SZ',
+        '%Y-%m-%dT%H:%M:%S%z',
+        '%d %b %Y %H:%M:%S',
+        '%Y-%m-%d %H:%M:%S'
+    ]
+    
+    for fmt in date_formats:
+        try:
+            dt = datetime.strptime(date_str.strip(), fmt)
+            
+            # Convert GMT/UTC to KST (UTC+9)
+            tz_str = date_str.strip().split()[-1] if date_str else ''
+            if tz_str in ['GMT', 'UTC'] or fmt.endswith('Z'):
+                dt = dt + timedelta(hours=9)
+            
+            return dt.strftime('%Y-%m-%d')
+        except:
+            continue
+    
+    # If parsing fails, return None instead of today's date to avoid duplicates
+    return None
+
+def fetch_rss_news(source_info, target_date, include_yesterday=False, health=None):
+    """Fetch news from RSS source for a specific date (optionally include yesterday)
+    
+    With a health dict, the timeout comes from the feed's history and the outcome
+    (latency, HTTP/parse errors) is recorded for the circuit breaker.
+    """
+    import xml.etree.ElementTree as ET
+    
+    # Simple headers often work better for RSS feeds
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
+        'Accept': 'application/rss+xml, application/xml, text/xml, */*'
+    }
+    name = source_info['name']
+    timeout = feed_timeout(get_feed_state(health, name)) if health is not None else FEED_DEFAULT_TIMEOUT
+    started = time.time()
+    
+    try:
+        response = hedged_get(source_info['url'], timeout, headers=headers)
+        
+        if response.status_code != 200:
+            log_message(f"  HTTP {response.status_code}: {source_info['name']}")
+            record_feed_result(health, name, time.time() - started, ok=False, error=f"HTTP {response.status_code}")
+            return []
         
         response.encoding = 'utf-8'
         
         if not response.content:
+            record_feed_result(health, name, time.time() - started, ok=False, parse_failed=True, error='empty body')
             return []
         
         try:
             root = ET.fromstring(response.content.strip())
         except ET.ParseError as e:
             log_message(f"  XML ParseError in {source_info['name']}: {str(e)[:50]}")
+            record_feed_result(health, name, time.time() - started, ok=False, parse_failed=True, error=str(e))
             return []
         
+        record_feed_result(health, name, time.time() - started, ok=True)
+        
         items = root.findall('.//item')
         
         news_list = []
@@ -524,7 +1595,7 @@ def fetch_rss_news(source_info, target_date, include_yesterday=False):
                 if media_content is not None:
                     image = media_content.get('url')
             
-            news_list.append({
+            news_list.append(Article({
                 'title': title,
                 'link': link,
                 'date': news_date,
@@ -532,21 +1603,34 @@ def fetch_rss_news(source_info, target_date, include_yesterday=False):
                 'description': clean_desc,
                 'image': image,
                 'is_english': is_english_text(title)
-            })
+            }))
         
         return news_list
     except Exception as e:
         log_message(f"Error fetching {source_info['name']}: {e}")
+        record_feed_result(health, name, time.time() - started, ok=False, error=str(e))
         return []
 
-def fetch_all_news_for_date(target_date, existing_links=None, include_yesterday=False):
-    """Fetch all news for a specific date from all sources"""
+def fetch_all_news_for_date(target_date, existing_links=None, include_yesterday=False, health=None):
+    """Fetch all news for a specific date from all sources
+    
+    Feeds with an open circuit or a low-yield backoff in `health` are skipped.
+    """
     all_news = []
     if existing_links is None:
         existing_links = set()
     
     for source in RSS_SOURCES:
-        news = fetch_rss_news(source, target_date, include_yesterday)
+        if deadline_exceeded():
+            log_message(f"  RSS budget exhausted, skipping {source['name']} and remaining feeds")
+            break
+        
+        skip_reason = feed_skip_reason(get_feed_state(health, source['name']))
+        if skip_reason:
+            log_message(f"  {source['name']}: {skip_reason}")
+            continue
+        
+        news = fetch_rss_news(source, target_date, include_yesterday, health)
         
         # Filter out links that already exist in previous days
         new_items = []
@@ -555,6 +1639,7 @@ def fetch_all_news_for_date(target_date, existing_links=None, include_yesterday=
                 new_items.append(item)
         
         all_news.extend(new_items)
+        record_feed_yield(health, source['name'], len(new_items))
         log_message(f"  {source['name']}: {len(new_items)} new articles (found {len(news)})")
         time.sleep(1)
     
@@ -567,57 +1652,259 @@ def fetch_all_news_for_date(target_date, existing_links=None, include_yesterday=
     
     return unique_news
 
+SOURCE_PRIORITY = {
+    # 1. 정책 (Policy)
+    '대한민국 정책브리핑': 0,
+    '정책브리핑': 0,
+    
+    # 2. 기술/트렌드 (Tech) - Domestic
+    '연합뉴스': 1,
+    'AI타임스': 2,
+    'ITWorld': 2,
+    
+    # 3. 해외 (Global)
+    'OpenAI': 3,
+    'HuggingFace': 3,
+    'TechCrunch': 3
+}
+
 def sort_by_source_priority(articles):
     """Sort articles by source priority: Policy -> Tech -> Global"""
-    source_priority = {
-        # 1. 정책 (Policy)
-        '대한민국 정책브리핑': 0,
-        '정책브리핑': 0,
-        
-        # 2. 기술/트렌드 (Tech) - Domestic
-        '연합뉴스': 1,
-        'AI타임스': 2,
-        'ITWorld': 2,
-        
-        # 3. 해외 (Global)
-        'OpenAI': 3,
-        'HuggingFace': 3,
-        'TechCrunch': 3
-    }
-    
     def get_priority(article):
         source = article.get('source', '')
-        return source_priority.get(source, 99)
+        return SOURCE_PRIORITY.get(source, 99)
     
     return sorted(articles, key=get_priority)
 
-def curate_news_list(articles):
-    """Curate news list using LLM - deduplicate and select top 30 important articles"""
+# ============================================================
+# Lexical Pre-Ranking (no embeddings)
+# ============================================================
+
+CURATION_CANDIDATES = 60                 # top-K sent to the LLM curator
+RANK_WEIGHTS = {
+    'priority': 0.20,
+    'salience': 0.30,
+    'relevance': 0.20,
+    'recency': 0.10,
+    'coverage': 0.20
+}
+
+# Topic anchors for the relevance term; matched against tokenize_text output
+TOPIC_TERMS = {
+    'ai', 'llm', 'gpt', 'openai', 'anthropic', 'gemini', 'nvidia', 'model', 'models', 'agent', 'agents',
+    'chatbot', 'robot', 'robotics', 'machine', 'learning', 'neural', 'generative', 'edtech',
+    '인공', '지능', '모델', '에이', '로봇', '에듀', '교과', '코딩', '생성', '학습', '반도', '도체'
+}
+
+STOPWORDS = {
+    'the', 'and', 'for', 'with', 'that', 'this', 'from', 'are', 'was', 'has', 'have', 'its',
+    'will', 'can', 'into', 'about', 'more', 'new', 'how', 'what', 'you', 'your', 'our', 'but',
+    'not', 'all', 'now', 'they', 'their', 'been', 'also', 'than', 'out', 'over', 'says'
+}
+
+def tokenize_text(text):
+    """Lowercased English words plus Hangul character bigrams"""
+    if not text:
+        return []
+    text = text.lower()
+    tokens = [w for w in re.findall(r'[a-z0-9]{2,}', text) if w not in STOPWORDS]
+    for run in re.findall(r'[가-힣]{2,}', text):
+        tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+def article_text(article):
+    return f"{article.get('original_title') or article.get('title', '')} {article.get('description', '')[:300]}"
+
+def build_idf(documents):
+    """Inverse document frequency over token lists"""
+    import math
+    from collections import Counter
+    df = Counter()
+    for tokens in documents:
+        df.update(set(tokens))
+    n = len(documents)
+    return {term: math.log((n + 1) / (count + 1)) + 1 for term, count in df.items()}, math.log(n + 1) + 1
+
+def rank_articles(articles, corpus_articles=None, today=None):
+    """Deterministic importance ranking by source priority, TF-IDF salience, topic
+    relevance, recency and cross-source coverage
+    
+    corpus_articles is the rolling 10-day window, so terms that show up every day
+    ("AI", "인공지능") weigh less than what is new today. Coverage counts how many
+    other sources share an article's most salient terms.
+    """
+    import math
+    from collections import Counter, defaultdict
     if not articles:
         return []
     
-    if len(articles) <= 30:
-        return sort_by_source_priority(articles)
+    today = today or get_kst_today()
+    today_dt = datetime.strptime(today, '%Y-%m-%d')
     
-    url = "https://api.z.ai/api/coding/paas/v4/chat/completions"
-    headers = {
-        'Authorization': f'Bearer {GLM_API_KEY}',
-        'Content-Type': 'application/json'
-    }
+    article_tokens = [tokenize_text(article_text(a)) for a in articles]
+    title_tokens = [set(tokenize_text(a.get('original_title') or a.get('title', ''))) for a in articles]
+    corpus_tokens = [tokenize_text(article_text(a)) for a in (corpus_articles or [])]
+    idf, default_idf = build_idf(corpus_tokens + article_tokens)
     
-    # 소스별로 균등하게 샘플링하여 큐레이션 (최대 100개)
-    from collections import defaultdict
-    source_articles = defaultdict(list)
-    for article in articles:
-        source_articles[article.get('source', 'Unknown')].append(article)
+    # A term is salient when it is rare in the window but shared by several of today's articles
+    batch_df = Counter()
+    for tokens in article_tokens:
+        batch_df.update(set(tokens))
     
-    # 각 소스에서 최대 20개씩 취하여 균등한 분포 확보
-    sampled_articles = []
-    for source, source_list in source_articles.items():
-        sampled_articles.extend(source_list[:20])
+    top_terms = []
+    salience = []
+    relevance = []
+    for tokens, title_set in zip(article_tokens, title_tokens):
+        unique = set(tokens)
+        weights = sorted(((idf.get(term, default_idf) * math.log(1 + batch_df[term]), term) for term in unique),
+                         reverse=True)
+        top = weights[:8]
+        salience.append(sum(w for w, _ in top) / 8)
+        top_terms.append({term for _, term in top})
+        # Topic words in the headline count double: captions like "AI 생성 영상" sit in bodies
+        relevance.append(min(1.0, (2 * len(title_set & TOPIC_TERMS) + len(unique & TOPIC_TERMS)) / 4))
+    max_salience = max(salience) or 1.0
+    
+    term_sources = defaultdict(set)
+    for article, terms in zip(articles, top_terms):
+        for term in terms:
+            term_sources[term].add(article.get('source', ''))
+    
+    scored = []
+    for i, article in enumerate(articles):
+        source = article.get('source', '')
+        priority = 1.0 / (1 + SOURCE_PRIORITY.get(source, 5))
+        
+        try:
+            days_old = max(0, (today_dt - datetime.strptime(article.get('date', today), '%Y-%m-%d')).days)
+        except ValueError:
+            days_old = 1
+        recency = 0.5 ** days_old
+        
+        other_sources = set()
+        for term in top_terms[i]:
+            other_sources |= term_sources[term]
+        other_sources.discard(source)
+        coverage = min(1.0, len(other_sources) / 3)
+        
+        score = (RANK_WEIGHTS['priority'] * priority
+                 + RANK_WEIGHTS['salience'] * salience[i] / max_salience
+                 + RANK_WEIGHTS['relevance'] * relevance[i]
+                 + RANK_WEIGHTS['recency'] * recency
+                 + RANK_WEIGHTS['coverage'] * coverage)
+        scored.append((-score, i, article))
+    
+    scored.sort(key=lambda x: (x[0], x[1]))
+    return [article for _, _, article in scored]
+
+CURATION_RUN_PICKS = 30                  # most articles a single run adds
+CURATION_DAILY_QUOTA = int(os.getenv('CURATION_DAILY_QUOTA', 90))
+CURATION_DUP_SIMILARITY = 0.6            # cosine over tokens at which an article repeats a pick
+CURATION_MARGIN = 10                     # candidates on each side of the cut-off left to the LLM
+
+def curation_vector(article):
+    from collections import Counter
+    return Counter(tokenize_text(article_text(article)))
+
+def cosine_similarity(a, b):
+    if not a or not b:
+        return 0.0
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(count * b.get(term, 0) for term, count in a.items())
+    if not dot:
+        return 0.0
+    norm = (sum(c * c for c in a.values()) * sum(c * c for c in b.values())) ** 0.5
+    return dot / norm
+
+def novelty_rank(ranked, selected):
+    """Re-order ranked articles by importance discounted by similarity to what is already picked
+    
+    Walks the ranking greedily: an article that repeats the day's stored selection or a
+    higher-ranked new article is dropped, and partial overlap lowers its score.
+    """
+    seen = [curation_vector(a) for a in selected]
+    scored = []
+    dropped = 0
+    for position, article in enumerate(ranked):
+        vector = curation_vector(article)
+        overlap = max((cosine_similarity(vector, other) for other in seen), default=0.0)
+        if overlap >= CURATION_DUP_SIMILARITY:
+            dropped += 1
+            continue
+        seen.append(vector)
+        importance = 1 - position / len(ranked)
+        scored.append((-importance * (1 - overlap), position, article))
+    scored.sort(key=lambda x: (x[0], x[1]))
+    return [article for _, _, article in scored], dropped
+
+def curate_news_list(articles, corpus_articles=None, stored_dates=None):
+    """Curate news list against the day's stored selection and its quota
+    
+    Only the newly collected articles are scored: pre-ranked locally, then discounted
+    for novelty against what earlier runs already selected for the same day. Clear
+    winners are accepted directly and the LLM only decides the marginal candidates
+    around the cut-off. The local order is the fallback when the API fails.
+    """
+    if not articles:
+        return []
+    
+    stored_dates = stored_dates or {}
+    selected_by_date = {}
+    for date in {a.get('date', get_kst_today()) for a in articles}:
+        selected_by_date[date] = [n for n in stored_dates.get(date, {}).get('news', []) if n.get('category') != 'AI Model']
+    remaining = {date: CURATION_DAILY_QUOTA - len(news) for date, news in selected_by_date.items()}
+    
+    articles = [a for a in articles if remaining[a.get('date', get_kst_today())] > 0]
+    picks = min(CURATION_RUN_PICKS, sum(max(0, r) for r in remaining.values()))
+    if not articles or picks <= 0:
+        log_message(f"  Daily quota of {CURATION_DAILY_QUOTA} reached, nothing new to curate")
+        return []
+    
+    selected = [n for news in selected_by_date.values() for n in news]
+    candidates, dropped = novelty_rank(rank_articles(articles, corpus_articles), selected)
+    if dropped:
+        log_message(f"  Novelty: dropped {dropped} articles already covered by today's selection")
+    
+    def take(ordered):
+        """First `picks` distinct articles that still fit their date's quota"""
+        left = dict(remaining)
+        chosen = []
+        seen = set()
+        for article in ordered:
+            key = article.get('link') or id(article)
+            date = article.get('date', get_kst_today())
+            if key in seen or left[date] <= 0:
+                continue
+            seen.add(key)
+            left[date] -= 1
+            chosen.append(article)
+            if len(chosen) >= picks:
+                break
+        return chosen
     
-    # 최대 100개만 LLM에 전달 (토큰 제한 고려)
-    sampled_articles = sampled_articles[:100]
+    if len(candidates) <= picks:
+        log_message(f"  Curated: {len(articles)} -> {len(candidates)} articles (no LLM needed)")
+        return sort_by_source_priority(take(candidates))
+    if deadline_exceeded():
+        log_message(f"  Curation budget exhausted, using top {picks} by local rank")
+        return sort_by_source_priority(take(candidates))
+    
+    accepted = candidates[:max(0, picks - CURATION_MARGIN)]
+    need = picks - len(accepted)
+    # 소스별 최대 20개 제한을 유지하면서 경계 후보만 LLM에 전달
+    from collections import defaultdict
+    per_source = defaultdict(int)
+    for article in accepted:
+        per_source[article.get('source', 'Unknown')] += 1
+    sampled_articles = []
+    for article in candidates[len(accepted):]:
+        source = article.get('source', 'Unknown')
+        if per_source[source] < 20:
+            per_source[source] += 1
+            sampled_articles.append(article)
+        if len(sampled_articles) >= min(CURATION_CANDIDATES, need + CURATION_MARGIN):
+            break
     
     prompt_parts = []
     for idx, article in enumerate(sampled_articles):
@@ -630,96 +1917,297 @@ def curate_news_list(articles):
 출처: {source}
 본문요약: {original_summary}""")
     
-    prompt = f"""다음 {len(sampled_articles)}개의 AI/에듀테크 뉴스 기사를 분석하여 큐레이션해주세요.
+    already = [a.get('translated_title') or a.get('title', '') for a in (selected + accepted)][-40:]
+    already_block = '\n'.join(f"- {title}" for title in already) or '- (없음)'
+    
+    prompt = f"""다음 {len(sampled_articles)}개의 AI/에듀테크 뉴스 후보 기사 중에서 {need}개를 골라주세요.
  
+ 오늘 이미 선정된 기사:
+ {already_block}
+ 
+ 후보 기사:
  {chr(10).join(prompt_parts)}
  
  큐레이션 요구사항:
- 1. 중복되거나 비슷한 내용의 기사는 제거하세요.
- 2. AI 및 에듀테크 분야에서 가장 중요하고 영향력 있는 상위 30개 기사만 선별하세요.
+ 1. 이미 선정된 기사와 중복되거나 비슷한 내용의 후보는 제외하세요.
+ 2. AI 및 에듀테크 분야에서 가장 중요하고 영향력 있는 {need}개 기사만 선별하세요.
  3. 선별 기준: 기술적 혁신성, 시장 영향력, 사용자 관련성, 뉴스 가치 등을 고려하세요.
  
- 출력 형식 (숫자로만 답변, 쉼표로 구분):
- 1,3,5,7,10,12,15,18,20,22,25,28,30,32,35,38,40,42,45,48,50,52,55,58,60,62,65,68,70,72
+ 출력 형식 (JSON):
+ {{"selected": [1, 3, 5, ...]}}
  
- 반드시 1부터 {len(sampled_articles)} 사이의 숫자 30개만 출력하고, 다른 설명 없이 숫자만 쉼표로 구분해주세요."""
+ 반드시 1부터 {len(sampled_articles)} 사이의 서로 다른 기사 번호 {need}개만 selected 배열에 담아 JSON으로만 답변해주세요."""
 
-    data = {
-        'model': 'glm-4.7',
-        'messages': [
-            {'role': 'system', 'content': '당신은 AI 및 에듀테크 뉴스 큐레이터입니다. 중복 제거와 중요 기사 선별에 능숙합니다. 반드시 숫자만 출력하세요.'},
-            {'role': 'user', 'content': prompt}
-        ],
-        'max_tokens': 500,
-        'temperature': 0.3,
-        'thinking': {'type': 'disabled'}
-    }
+    messages = [
+        {'role': 'system', 'content': '당신은 AI 및 에듀테크 뉴스 큐레이터입니다. 중복 제거와 중요 기사 선별에 능숙합니다. 반드시 JSON만 출력하세요.'},
+        {'role': 'user', 'content': prompt}
+    ]
     
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=60)
-        if response.status_code == 200:
-            result = response.json()
-            if 'choices' in result and len(result['choices']) > 0:
-                content = result['choices'][0]['message']['content'].strip()
-                
-                indices = []
-                for num_str in content.split(','):
-                    try:
-                        num = int(num_str.strip())
-                        if 1 <= num <= len(sampled_articles):
-                            indices.append(num - 1)
-                    except:
-                        continue
-                
-                if len(indices) >= 30:
-                    indices = indices[:30]
-                    curated = [sampled_articles[i] for i in indices]
-                    log_message(f"  Curated: {len(articles)} -> {len(curated)} articles")
-                    return sort_by_source_priority(curated)
-                else:
-                    log_message(f"  Curation returned only {len(indices)} articles, using first 30")
-                    return sort_by_source_priority(articles[:30])
+        content, _ = call_glm(messages, max_tokens=300, temperature=0.3, timeout=60, json_mode=True)
+        indices = validate_selection(parse_json_object(content), len(sampled_articles))
+        
+        # Targeted follow-up: ask only for the missing picks instead of re-running the curation
+        if len(indices) < need:
+            log_message(f"  Curation returned {len(indices)} valid picks, requesting {need - len(indices)} more")
+            messages.append({'role': 'assistant', 'content': content})
+            messages.append({'role': 'user', 'content': f"""이미 선택된 번호: {', '.join(str(i + 1) for i in indices)}
+ 선택되지 않은 기사 중에서 {need - len(indices)}개를 추가로 골라 {{"selected": [...]}} JSON으로만 답변해주세요."""})
+            content, _ = call_glm(messages, max_tokens=200, temperature=0.3, timeout=60, json_mode=True)
+            for idx in validate_selection(parse_json_object(content), len(sampled_articles)):
+                if idx not in indices:
+                    indices.append(idx)
+        
+        if len(indices) >= need:
+            curated = take(accepted + [sampled_articles[i] for i in indices[:need]] + candidates)
+            log_message(f"  Curated: {len(articles)} -> {len(curated)} articles "
+                        f"({len(accepted)} by rank, {need} by LLM from {len(sampled_articles)} marginal)")
+            return sort_by_source_priority(curated)
         else:
-            log_message(f"  Curation API error {response.status_code}, using first 30")
-            return sort_by_source_priority(articles[:30])
+            log_message(f"  Curation returned only {len(indices)} articles, using top {picks} by local rank")
+            return sort_by_source_priority(take(candidates))
     except Exception as e:
-        log_message(f"  Curation error: {e}, using first 30")
-        return sort_by_source_priority(articles[:30])
+        log_message(f"  Curation error: {e}, using top {picks} by local rank")
+        return sort_by_source_priority(take(candidates))
+
+def validate_selection(parsed, article_count):
+    """Schema check for {"selected": [n, ...]}, returns unique 0-based indices in order"""
+    if not parsed or not isinstance(parsed.get('selected'), list):
+        return []
+    indices = []
+    for num in parsed['selected']:
+        try:
+            num = int(num)
+        except (TypeError, ValueError):
+            continue
+        if 1 <= num <= article_count and num - 1 not in indices:
+            indices.append(num - 1)
+    return indices
+
+# Token budget for one summarization request (glm-4.7 limits, with headroom)
+SUMMARY_MAX_INPUT_TOKENS = 6000
+SUMMARY_MAX_OUTPUT_TOKENS = 4000
+SUMMARY_MAX_BATCH_ARTICLES = 15
+SUMMARY_PROMPT_OVERHEAD_TOKENS = 450       # instructions + output format example
+SUMMARY_OUTPUT_TOKENS_KO = 260             # title + 4 bullets + keyword, already Korean
+SUMMARY_OUTPUT_TOKENS_EN = 300             # translated titles run a little longer
+
+def estimate_tokens(text):
+    """Rough token estimate: Hangul/CJK ~1 token per char, other text ~4 chars per token"""
+    if not text:
+        return 0
+    wide_chars = sum(1 for c in text if ord(c) >= 0x1100)
+    return wide_chars + (len(text) - wide_chars) // 4 + 1
+
+def build_summary_prompt_part(idx, article, title_hint=None):
+    original_title = article.get('original_title', article.get('title', ''))
+    original_summary = article.get('original_summary', article.get('description', '')[:300])
+    language = 'EN' if article.get('is_english', False) else 'KO'
+    
+    # A title already in translation memory is sent translated, so only the body needs work
+    title_line = f"제목(번역 완료, 그대로 사용): {title_hint}" if title_hint else f"제목: {original_title}"
+    return f"""=== 기사 {idx + 1} ===
+{title_line}
+원본언어: {language}
+본문요약: {original_summary}"""
+
+def estimate_summary_output_tokens(article):
+    return SUMMARY_OUTPUT_TOKENS_EN if article.get('is_english', False) else SUMMARY_OUTPUT_TOKENS_KO
+
+def plan_summary_batches(articles, max_articles=SUMMARY_MAX_BATCH_ARTICLES):
+    """Greedily pack articles into batches that fit the input and output token budgets"""
+    batches = []
+    batch = []
+    input_tokens = SUMMARY_PROMPT_OVERHEAD_TOKENS
+    output_tokens = 0
+    
+    for article in articles:
+        article_input = estimate_tokens(build_summary_prompt_part(len(batch), article))
+        article_output = estimate_summary_output_tokens(article)
+        
+        if batch and (len(batch) >= max_articles
+                      or input_tokens + article_input > SUMMARY_MAX_INPUT_TOKENS
+                      or output_tokens + article_output > SUMMARY_MAX_OUTPUT_TOKENS):
+            batches.append(batch)
+            batch = []
+            input_tokens = SUMMARY_PROMPT_OVERHEAD_TOKENS
+            output_tokens = 0
+        
+        batch.append(article)
+        input_tokens += article_input
+        output_tokens += article_output
+    
+    if batch:
+        batches.append(batch)
+    return batches
+
+# ============================================================
+# Translation Memory (English title / summary reuse)
+# ============================================================
+
+TM_PATH = 'translation_memory.json'
+TM_FUZZY_THRESHOLD = 0.85                # word Jaccard needed for a fuzzy hit
+TM_SIGNATURE_WORDS = 40                  # words kept per summary for fuzzy matching
+TM_RETENTION_DAYS = 60
+
+def tm_normalize(text):
+    """Lowercased words without punctuation or feed boilerplate"""
+    text = re.sub(r'The post .* appeared first on .*$', '', text or '', flags=re.IGNORECASE)
+    text = re.sub(r'\s*[|–—-]\s*(AI Business|TechCrunch|MIT News|VentureBeat)\s*$', '', text, flags=re.IGNORECASE)
+    return ' '.join(re.findall(r'[a-z0-9가-힣]+', text.lower()))
+
+def tm_numbers(words):
+    return {w for w in words if w.isdigit()}
+
+def tm_lookup(table, text, signature_words=None, fuzzy=True):
+    """Exact hit on the normalized key, else (when `fuzzy`) the best fuzzy hit above
+    TM_FUZZY_THRESHOLD
+    
+    Fuzzy hits must carry exactly the same numbers, so "GPT-4" never reuses "GPT-5"
+    and "raises $20M" never reuses "$30M".
+    """
+    normalized = tm_normalize(text)
+    if not normalized:
+        return None
+    words = normalized.split()[:signature_words] if signature_words else normalized.split()
+    key = hashlib.sha1(' '.join(words).encode('utf-8')).hexdigest()[:16]
+    if key in table:
+        return table[key]
+    if not fuzzy:
+        return None
+    
+    word_set = set(words)
+    numbers = tm_numbers(word_set)
+    best, best_score = None, TM_FUZZY_THRESHOLD
+    for entry in table.values():
+        other = set(entry['source'].split())
+        if len(other) < len(word_set) * TM_FUZZY_THRESHOLD or len(word_set) < len(other) * TM_FUZZY_THRESHOLD:
+            continue
+        score = len(word_set & other) / len(word_set | other)
+        if score >= best_score and tm_numbers(other) == numbers:
+            best, best_score = entry, score
+    return best
+
+def tm_store(table, text, entry, signature_words=None):
+    normalized = tm_normalize(text)
+    if not normalized:
+        return
+    words = normalized.split()[:signature_words] if signature_words else normalized.split()
+    source = ' '.join(words)
+    table[hashlib.sha1(source.encode('utf-8')).hexdigest()[:16]] = {'source': source, **entry}
+
+def load_translation_memory(path=TM_PATH):
+    try:
+        with open(path, 'rb') as f:
+            memory = json_loads(f.read())
+    except (FileNotFoundError, ValueError):
+        memory = {}
+    memory.setdefault('titles', {})
+    memory.setdefault('summaries', {})
+    return memory
+
+def save_translation_memory(memory, path=TM_PATH):
+    cutoff = (get_kst_now() - timedelta(days=TM_RETENTION_DAYS)).strftime('%Y-%m-%d')
+    for table in (memory['titles'], memory['summaries']):
+        for key in [k for k, entry in table.items() if entry.get('used', '') < cutoff]:
+            del table[key]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json_dumps(memory))
+
+def apply_translation_memory(articles, memory):
+    """Pre-fill English articles from memory, returns (articles still needing the LLM, title hints)
+    
+    An article whose title and summary both hit is finished without the LLM. A title-only
+    hit is handed to the LLM already translated (title_hints maps id(article) to it).
+    """
+    today = get_kst_today()
+    pending = []
+    title_hints = {}
+    full_hits = 0
+    
+    for article in articles:
+        if not article.get('is_english', False):
+            pending.append(article)
+            continue
+        # Titles are short, so one changed word ("acquires" vs "sues") flips the meaning: exact only
+        title_hit = tm_lookup(memory['titles'], article.get('original_title', article.get('title', '')), fuzzy=False)
+        summary_hit = tm_lookup(memory['summaries'], article.get('original_summary', ''), TM_SIGNATURE_WORDS)
+        if title_hit:
+            title_hit['used'] = today
+        if title_hit and summary_hit:
+            summary_hit['used'] = today
+            article['translated_title'] = title_hit['text']
+            article['summary'] = summary_hit['text']
+            article['category_keyword'] = summary_hit['keyword']
+            full_hits += 1
+            continue
+        if title_hit:
+            title_hints[id(article)] = title_hit['text']
+        pending.append(article)
     
-    return sort_by_source_priority(articles[:30])
+    if full_hits or title_hints:
+        log_message(f"  Translation memory: {full_hits} articles reused, {len(title_hints)} titles pre-filled")
+    return pending, title_hints
 
-def batch_summarize(articles):
-    """Batch summarize 10 articles at a time using GLM API"""
+def remember_translations(memory, articles):
+    """Store LLM translations of English articles for later reuse"""
+    today = get_kst_today()
+    for article in articles:
+        if not article.get('is_english', False):
+            continue
+        tm_store(memory['titles'], article.get('original_title', ''),
+                 {'text': article['translated_title'], 'used': today})
+        tm_store(memory['summaries'], article.get('original_summary', ''),
+                 {'text': article['summary'], 'keyword': article.get('category_keyword', ''), 'used': today},
+                 TM_SIGNATURE_WORDS)
+
+def batch_summarize(articles, on_article=None):
+    """Summarize articles in token-aware batches using GLM API
+    
+    The model answers in JSON lines (one object per article). Records that are
+    truncated or fail the schema check are re-planned into smaller batches and
+    re-issued on their own, without repeating the articles that came back valid.
+    
+    With GLM_STREAMING, on_article(article) is called as soon as each article's
+    line finishes streaming, so downstream stages can start on it early.
+    """
     if not articles:
         return articles
     
-    url = "https://api.z.ai/api/coding/paas/v4/chat/completions"
-    headers = {
-        'Authorization': f'Bearer {GLM_API_KEY}',
-        'Content-Type': 'application/json'
-    }
+    memory = load_translation_memory()
+    pending, title_hints = apply_translation_memory(articles, memory)
+    if on_article:
+        pending_ids = {id(article) for article in pending}
+        for article in articles:
+            if id(article) not in pending_ids:
+                on_article(article)
     
-    batch_size = 10
-    processed = 0
+    queue = plan_summary_batches(pending)
+    batch_no = 0
+    summarized = []
     
-    for i in range(0, len(articles), batch_size):
-        batch = articles[i:i+batch_size]
+    while queue:
+        batch = queue.pop(0)
+        batch_no += 1
         
-        # Pre-fill summary with description as fallback
+        # Pre-fill an extractive four-line summary as fallback
         for article in batch:
             if not article.get('summary'):
-                article['summary'] = article.get('description', '')[:300]
+                article['summary'] = fallback_summary(article)
         
-        prompt_parts = []
-        for idx, article in enumerate(batch):
-            original_title = article.get('original_title', article.get('title', ''))
-            original_summary = article.get('original_summary', article.get('description', '')[:300])
-            language = 'EN' if article.get('is_english', False) else 'KO'
-            
-            prompt_parts.append(f"""=== 기사 {idx + 1} ===
-제목: {original_title}
-원본언어: {language}
-본문요약: {original_summary}""")
+        if deadline_exceeded():
+            remaining = len(batch) + sum(len(b) for b in queue)
+            for pending_batch in queue:
+                for article in pending_batch:
+                    if not article.get('summary'):
+                        article['summary'] = fallback_summary(article)
+            log_message(f"  Summarize budget exhausted, {remaining} articles keep extractive summaries")
+            break
+        
+        prompt_parts = [build_summary_prompt_part(idx, article, title_hints.get(id(article)))
+                        for idx, article in enumerate(batch)]
+        max_tokens = min(SUMMARY_MAX_OUTPUT_TOKENS,
+                         int(sum(estimate_summary_output_tokens(a) for a in batch) * 1.3) + 200)
         
         prompt = f"""다음 {len(batch)}개 기사를 한국어로 처리해주세요.
  
@@ -727,145 +2215,623 @@ def batch_summarize(articles):
  
  처리 요구사항:
  1. 영문 기사는 제목과 본문 요약을 모두 자연스러운 한국어로 번역하세요.
- 2. 각 기사의 핵심을 불렛 포인트(•) 4개로 구조화하여 요약하세요. 줄글보다 빠르게 파악할 수 있도록 각 핵심은 명확하고 간결하게 작성하세요.
+ 2. 각 기사의 핵심을 4개의 문장으로 구조화하여 요약하세요. 줄글보다 빠르게 파악할 수 있도록 각 핵심은 명확하고 간결하게 작성하세요 (20자 내외).
  3. 기사의 핵심 키워드 1개를 추출하세요 (최대 5자).
  
- 출력 형식:
- === 기사 1 ===
- 번역된 제목: [영문인 경우 한국어 제목, 한글인 경우 기존 제목]
- 요약: • 첫 번째 핵심 내용 (20자 내외)
- • 두 번째 핵심 내용 (20자 내외)
- • 세 번째 핵심 내용 (20자 내외)
- • 네 번째 핵심 내용 (20자 내외)
- 키워드: [핵심 키워드]
+ 출력 형식 (JSON Lines - 기사마다 한 줄에 JSON 객체 하나, 다른 텍스트 금지):
+ {{"id": 1, "title": "한국어 제목 (한글 기사는 기존 제목)", "summary": ["첫 번째 핵심", "두 번째 핵심", "세 번째 핵심", "네 번째 핵심"], "keyword": "키워드"}}
+ {{"id": 2, ...}}
  
- === 기사 2 ===
- ...
- (순서대로 답변)
- 
- 반드시 한국어로 답변하고, 모든 기사를 순서대로 처리해주세요."""
-
-        data = {
-            'model': 'glm-4.7',
-            'messages': [
-                {'role': 'system', 'content': '당신은 한국 IT 뉴스 에디터입니다. 모든 응답은 한국어로 작성하세요.'},
-                {'role': 'user', 'content': prompt}
-            ],
-            'max_tokens': 2000,
-            'temperature': 0.7,
-            'thinking': {'type': 'disabled'}
-        }
+ 반드시 한국어로 답변하고, 모든 기사를 id 순서대로 처리해주세요."""
+
+        messages = [
+            {'role': 'system', 'content': '당신은 한국 IT 뉴스 에디터입니다. 모든 응답은 한국어로 작성하고, 지정된 JSON Lines 형식만 출력하세요.'},
+            {'role': 'user', 'content': prompt}
+        ]
         
+        completed = set()
+        truncated = False
         retries = 3
         for attempt in range(retries):
             try:
-                response = requests.post(url, headers=headers, json=data, timeout=120)
-                if response.status_code == 200:
-                    result = response.json()
-                    if 'choices' in result and len(result['choices']) > 0:
-                        content = result['choices'][0]['message']['content']
-                        log_message(f"  Batch {i//batch_size + 1}: API success")
-                        parse_batch_response(batch, content)
-                        break
+                if GLM_STREAMING:
+                    truncated = stream_batch_response(batch, messages, max_tokens, completed, on_article)
                 else:
-                    log_message(f"  Batch {i//batch_size + 1}: API error {response.status_code} (Attempt {attempt+1}/{retries})")
+                    content, finish_reason = call_glm(messages, max_tokens=max_tokens, temperature=0.7, timeout=120)
+                    truncated = finish_reason == 'length'
+                    completed = parse_batch_response(batch, content)
+                    if on_article:
+                        for idx in sorted(completed):
+                            on_article(batch[idx])
+                if completed:
+                    log_message(f"  Batch {batch_no} ({len(batch)} articles): API success, "
+                                f"{len(completed)} valid{' (truncated)' if truncated else ''}")
+                    break
+                log_message(f"  Batch {batch_no}: no valid records (Attempt {attempt+1}/{retries})")
             except Exception as e:
-                log_message(f"  Batch {i//batch_size + 1}: Error - {e} (Attempt {attempt+1}/{retries})")
+                log_message(f"  Batch {batch_no}: Error - {e} (Attempt {attempt+1}/{retries})")
+                if completed:
+                    # Stream dropped partway: keep what finished and re-issue the rest
+                    log_message(f"  Batch {batch_no}: keeping {len(completed)} articles from interrupted stream")
+                    break
             
+            if deadline_exceeded():
+                break
             if attempt < retries - 1:
                 time.sleep(5) # Wait before retry
         
-        processed += len(batch)
-        time.sleep(2)
+        summarized.extend(batch[idx] for idx in completed)
+        
+        # Re-issue only the articles that did not come back valid
+        missing = [article for idx, article in enumerate(batch) if idx not in completed]
+        if completed and missing:
+            max_articles = max(1, len(batch) // 2) if truncated else SUMMARY_MAX_BATCH_ARTICLES
+            log_message(f"  Batch {batch_no}: re-issuing {len(missing)} missing articles")
+            queue[0:0] = plan_summary_batches(missing, max_articles=max_articles)
+        
+        if queue and not deadline_exceeded():
+            time.sleep(2)
     
+    for article in pending:
+        if id(article) in title_hints:
+            article['translated_title'] = title_hints[id(article)]
+    remember_translations(memory, summarized)
+    save_translation_memory(memory)
     return articles
 
+def apply_article_record(articles, record):
+    """Validate one record and copy its fields onto the article, returns its index or None"""
+    validated = validate_article_record(record, len(articles))
+    if validated is None:
+        return None
+    idx, fields = validated
+    articles[idx].update(fields)
+    articles[idx]['title'] = fields['translated_title']
+    return idx
+
 def parse_batch_response(articles, response):
-    """Parse batch API response and update articles"""
-    sections = re.split(r'===\s*기사\s*(\d+)\s*===', response)
+    """Parse a JSON-lines batch response in one pass and update articles
     
-    for i in range(1, len(sections), 2):
-        try:
-            idx = int(sections[i]) - 1
-            if idx < 0 or idx >= len(articles):
-                continue
-            
-            section_content = sections[i + 1]
-            
-            # Extract translated title
-            title_match = re.search(r'번역된\s*제목:\s*(.+?)(?:\n|$)', section_content)
-            if title_match:
-                articles[idx]['translated_title'] = title_match.group(1).strip()
-            
-            # Extract summary (키워드: 라인 전까지만 추출)
-            summary_match = re.search(r'요약:\s*(.+?)(?:키워드:|$)', section_content, re.DOTALL)
-            if summary_match:
-                summary_text = summary_match.group(1).strip()
-                # 키워드 라인이 혼입된 경우 제거
-                summary_text = re.sub(r'키워드:.*$', '', summary_text, flags=re.MULTILINE).strip()
-                articles[idx]['summary'] = summary_text
-            
-            # Extract keyword
-            keyword_match = re.search(r'키워드:\s*(.+?)(?:\n|$)', section_content)
-            if keyword_match:
-                articles[idx]['category_keyword'] = keyword_match.group(1).strip()
-            
-            # Update title if translated
-            if articles[idx].get('translated_title'):
-                articles[idx]['title'] = articles[idx]['translated_title']
-            
-            # Ensure summary exists
-            if not articles[idx].get('summary'):
-                articles[idx]['summary'] = '전체 기사 내용은 링크를 확인하세요.'
-                
-        except Exception as e:
-            log_message(f"    Parse error for article {i}: {e}")
-
-def load_all_news():
-    """Load all news from JSON file"""
-    try:
-        with open('all_news.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {'dates': []}
-    except json.JSONDecodeError:
-        return {'dates': []}
-
-def save_all_news(data):
-    """Save all news to JSON file"""
-    with open('all_news.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-def maintain_10_day_window(data):
-    """Keep only the last 10 days of data"""
-    if len(data['dates']) <= 10:
-        return data
+    Returns the set of article indices whose record passed the schema check. A
+    record cut off by max_tokens fails to parse and is simply left out.
+    """
+    completed = set()
     
-    sorted_dates = sorted(data['dates'], key=lambda x: x['date'], reverse=True)
-    data['dates'] = sorted_dates[:10]
-    return data
+    for record in parse_json_lines(response):
+        idx = apply_article_record(articles, record)
+        if idx is not None:
+            completed.add(idx)
+    
+    return completed
 
-def generate_html(news_items):
-    """Generate HTML with all 10 days displayed - Fixed Version"""
-    update_time = get_kst_timestamp()
+def stream_batch_response(articles, messages, max_tokens, completed, on_article=None):
+    """Stream one batch and apply each JSON line as soon as its newline arrives
     
-    all_data = load_all_news()
-    all_data = maintain_10_day_window(all_data)
+    completed is updated in place, so articles finished before a dropped stream
+    survive the exception. Returns True when generation stopped at max_tokens.
+    """
+    def apply_line(line):
+        for record in parse_json_lines(line):
+            idx = apply_article_record(articles, record)
+            if idx is not None and idx not in completed:
+                completed.add(idx)
+                if on_article:
+                    on_article(articles[idx])
     
-    all_news_flat = []
-    for date_entry in all_data['dates']:
-        for news in date_entry['news']:
-            n_copy = news.copy()
-            n_copy['date'] = date_entry['date']
-            all_news_flat.append(n_copy)
+    buffer = ''
+    finish_reason = None
+    for delta, reason in stream_glm(messages, max_tokens, 0.7, 120):
+        finish_reason = reason or finish_reason
+        buffer += delta
+        while '\n' in buffer:
+            line, buffer = buffer.split('\n', 1)
+            apply_line(line)
+    apply_line(buffer)
     
-    all_news_by_date = []
-    for date_entry in all_data['dates']:
-        all_news_by_date.append({
+    return finish_reason == 'length'
+
+# ============================================================
+# JSON Serialization Backend
+# ============================================================
+
+# Compact on-disk layout by default; NEWS_JSON_PRETTY=1 writes indented JSON for debugging
+NEWS_JSON_PRETTY = os.getenv('NEWS_JSON_PRETTY', '0') == '1'
+NEWS_JSON_PATH = 'all_news.json'
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+JSON_BACKEND = 'orjson' if orjson else 'ujson' if ujson else 'json'
+
+def json_dumps(obj, pretty=False, backend=None):
+    """Serialize to a str (UTF-8, non-ASCII kept) with the fastest available backend"""
+    backend = backend or JSON_BACKEND
+    if backend == 'orjson':
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode('utf-8')
+    if backend == 'ujson':
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False, indent=2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+def json_loads(text, backend=None):
+    backend = backend or JSON_BACKEND
+    if backend == 'orjson':
+        return orjson.loads(text)
+    if backend == 'ujson':
+        return ujson.loads(text)
+    return json.loads(text)
+
+# ============================================================
+# Article Records
+# ============================================================
+
+ARTICLE_FIELDS = ('title', 'link', 'date', 'source', 'description', 'image', 'is_english',
+                  'summary', 'category_keyword', 'category')
+_ARTICLE_FIELD_SET = frozenset(ARTICLE_FIELDS)
+INTERNED_FIELDS = frozenset({'date', 'source', 'category', 'category_keyword'})
+
+# Fields the page actually renders (plus date and id added by page_record)
+PAGE_FIELDS = ('title', 'link', 'source', 'summary', 'image', 'category_keyword', 'category')
+
+class Article(MutableMapping):
+    """Slotted article record that keeps the dict interface the pipeline uses
+    
+    Repeated strings (source, category, keyword, date) are interned. The redundant
+    views are derived instead of stored: translated_title is the (translated) title,
+    original_title is only kept while it differs from title, original_summary is
+    description[:300] and description falls back to summary for model entries.
+    Iterating yields only the non-redundant keys, which is what gets serialized.
+    """
+    __slots__ = ARTICLE_FIELDS + ('_original_title', '_original_summary', '_extra')
+    
+    def __init__(self, data=None, **fields):
+        for name in self.__slots__:
+            setattr(self, name, None)
+        if data:
+            self.update(data)
+        if fields:
+            self.update(fields)
+    
+    def __getitem__(self, key):
+        if key in _ARTICLE_FIELD_SET:
+            value = getattr(self, key)
+            if value is None and key == 'description':
+                value = self.summary
+        elif key == 'original_title':
+            value = self._original_title if self._original_title is not None else self.title
+        elif key == 'translated_title':
+            value = self.title
+        elif key == 'original_summary':
+            value = self._original_summary
+            if value is None and self.description is not None:
+                value = self.description[:300]
+        else:
+            value = self._extra.get(key) if self._extra else None
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        if key in _ARTICLE_FIELD_SET:
+            if key in INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+        elif key == 'original_title':
+            self._original_title = value
+        elif key == 'translated_title':
+            self.title = value
+        elif key == 'original_summary':
+            derived = self.description[:300] if self.description is not None else None
+            self._original_summary = None if value == derived else value
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+    
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        if key in _ARTICLE_FIELD_SET:
+            setattr(self, key, None)
+        elif key == 'original_title':
+            self._original_title = None
+        elif key == 'original_summary':
+            self._original_summary = None
+        elif key in (self._extra or {}):
+            del self._extra[key]
+    
+    def __iter__(self):
+        for name in ARTICLE_FIELDS:
+            value = getattr(self, name)
+            if value is None or (name == 'is_english' and not value):
+                continue
+            if name == 'description' and value == self.summary:
+                continue
+            yield name
+        if self._original_title is not None and self._original_title != self.title:
+            yield 'original_title'
+        if self._original_summary is not None:
+            yield 'original_summary'
+        if self._extra:
+            yield from self._extra
+    
+    def __len__(self):
+        return sum(1 for _ in self)
+    
+    def __repr__(self):
+        return f"Article({self.to_dict()!r})"
+    
+    def copy(self):
+        return Article(self)
+    
+    def to_dict(self, exclude=()):
+        """Non-redundant fields only"""
+        return {key: self[key] for key in self if key not in exclude}
+
+def serialize_news_data(data):
+    """Plain-dict form of the dataset; per-article dates are implied by their date entry"""
+    dates = []
+    for date_entry in data.get('dates', []):
+        dates.append({
             'date': date_entry['date'],
             'update_time': date_entry.get('update_time', ''),
-            'news_count': len(date_entry['news'])
+            'news': [Article(news).to_dict(exclude=('date',)) if not isinstance(news, Article)
+                     else news.to_dict(exclude=('date',)) for news in date_entry.get('news', [])]
         })
+    serialized = {'dates': dates}
+    serialized.update((key, value) for key, value in data.items() if key != 'dates')
+    return serialized
+
+def deserialize_news_data(data):
+    """Turn loaded dicts into Article records, restoring each article's date"""
+    for date_entry in data.get('dates', []):
+        date_entry['news'] = [Article(news, date=date_entry['date']) for news in date_entry.get('news', [])]
+    return data
+
+COMPACT_HEADER = '{"dates":['
+
+def iter_news_dates(path=NEWS_JSON_PATH):
+    """Stream date entries (with Article records) from a compact all_news.json
+    
+    The compact layout puts one date entry per line, so only one entry's text is
+    parsed at a time. Yields (date_entry, None) per line and finally (None, extra)
+    with the remaining top-level keys. Yields nothing for other layouts.
+    """
+    header = COMPACT_HEADER.encode('utf-8')
+    with open(path, 'rb') as f:
+        if f.readline().rstrip(b'\n') != header:
+            return
+        for line in f:
+            line = line.rstrip(b'\n')
+            if not line:
+                continue
+            if line.startswith(b']'):
+                yield None, json_loads(b'{' + line[1:].lstrip(b','))
+                return
+            date_entry = json_loads(line.rstrip(b','))
+            date_entry['news'] = [Article(news, date=date_entry['date']) for news in date_entry.get('news', [])]
+            yield date_entry, None
+
+def load_all_news(path=NEWS_JSON_PATH):
+    """Load all news from JSON file (streamed for the compact layout)"""
+    try:
+        data = {'dates': []}
+        streamed = False
+        for date_entry, extra in iter_news_dates(path):
+            streamed = True
+            if date_entry is not None:
+                data['dates'].append(date_entry)
+            else:
+                data.update(extra)
+        if streamed:
+            return data
+        
+        # Indented or legacy file
+        with open(path, 'rb') as f:
+            return deserialize_news_data(json_loads(f.read()))
+    except FileNotFoundError:
+        return {'dates': []}
+    except ValueError:
+        return {'dates': []}
+
+def save_all_news(data, path=NEWS_JSON_PATH, pretty=None):
+    """Save all news to JSON file
+    
+    Compact mode writes one date entry per line inside an otherwise normal JSON
+    document, so iter_news_dates can stream it back; pretty mode is plain indent=2.
+    """
+    serialized = serialize_news_data(data)
+    pretty = NEWS_JSON_PRETTY if pretty is None else pretty
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        if pretty:
+            f.write(json_dumps(serialized, pretty=True))
+            return
+        f.write(COMPACT_HEADER + '\n')
+        f.write(',\n'.join(json_dumps(date_entry) for date_entry in serialized['dates']))
+        rest = {key: value for key, value in serialized.items() if key != 'dates'}
+        f.write('\n]' + (',' + json_dumps(rest)[1:] if rest else '}') + '\n')
+
+# ============================================================
+# Binary Archive (memory-mapped, dates older than the window)
+# ============================================================
+
+NEWS_ARCHIVE_PATH = 'news_archive.bin'
+NEWS_ARCHIVE_RETENTION_DAYS = int(os.getenv('NEWS_ARCHIVE_RETENTION_DAYS', 365))   # 0 keeps everything
+ARCHIVE_MAGIC = b'SNEWSARC'
+ARCHIVE_VERSION = 1
+ARCHIVE_HEADER = '<8sHIQQI'              # magic, version, slots, table offset, meta offset, meta length
+ARCHIVE_SLOT = '<QQ'                     # key hash, record offset (hash 0 = empty slot)
+
+def archive_key_hash(key):
+    return int.from_bytes(hashlib.sha1(key.encode('utf-8')).digest()[:8], 'little') | 1
+
+class NewsArchive:
+    """Read-only view of news_archive.bin through mmap
+    
+    Records are length-prefixed JSON (u32 + bytes). An open-addressing hash table of
+    (key hash, offset) slots maps 'date:<YYYY-MM-DD>' to a date record listing its
+    article offsets, and 'link:<url>' to the article record, so a lookup touches a
+    couple of pages instead of parsing the archive.
+    """
+    
+    def __init__(self, path=NEWS_ARCHIVE_PATH):
+        import mmap
+        import struct
+        self._struct = struct
+        self._file = open(path, 'rb')
+        self._map = None
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, self.slots, self.table_offset, meta_offset, meta_length = \
+                struct.unpack_from(ARCHIVE_HEADER, self._map, 0)
+            if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION:
+                raise ValueError(f"{path} is not a news archive")
+            self.meta = json_loads(self._map[meta_offset:meta_offset + meta_length])
+        except Exception as e:
+            # Short, empty or half-written files all surface as ValueError
+            self.close()
+            raise ValueError(f"{path} is not a readable news archive: {e}") from e
+    
+    def close(self):
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def dates(self):
+        return list(self.meta.get('dates', []))
+    
+    def _record(self, offset):
+        return json_loads(self._payload(offset))
+    
+    def _payload(self, offset):
+        (length,) = self._struct.unpack_from('<I', self._map, offset)
+        return self._map[offset + 4:offset + 4 + length]
+    
+    def _lookup(self, key):
+        wanted = archive_key_hash(key)
+        slot = wanted & (self.slots - 1)
+        for _ in range(self.slots):
+            key_hash, offset = self._struct.unpack_from(ARCHIVE_SLOT, self._map, self.table_offset + slot * 16)
+            if key_hash == 0:
+                return None
+            if key_hash == wanted:
+                return offset
+            slot = (slot + 1) & (self.slots - 1)
+        return None
+    
+    def table(self):
+        """(key hash, offset) for every occupied slot"""
+        for slot in range(self.slots):
+            key_hash, offset = self._struct.unpack_from(ARCHIVE_SLOT, self._map, self.table_offset + slot * 16)
+            if key_hash:
+                yield key_hash, offset
+    
+    def get_date(self, date):
+        """Date entry with Article records, or None"""
+        offset = self._lookup(f'date:{date}')
+        if offset is None:
+            return None
+        record = self._record(offset)
+        return {
+            'date': record['date'],
+            'update_time': record.get('update_time', ''),
+            'news': [Article(self._record(o), date=record['date']) for o in record['offsets']]
+        }
+    
+    def get_article(self, link):
+        offset = self._lookup(f'link:{link}')
+        if offset is None:
+            return None
+        record = self._record(offset)
+        return Article(record)
+    
+    def iter_dates(self):
+        for date in sorted(self.dates(), reverse=True):
+            yield self.get_date(date)
+
+def open_news_archive(path=NEWS_ARCHIVE_PATH, strict=False):
+    """NewsArchive for path, or None when there is no archive yet
+    
+    A file that exists but cannot be parsed raises ValueError unless `strict` is off,
+    in which case it is logged and treated as absent for readers.
+    """
+    try:
+        return NewsArchive(path)
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        if strict:
+            raise
+        log_message(f"  {e}")
+        return None
+
+def append_to_news_archive(date_entries, path=NEWS_ARCHIVE_PATH, retention_days=None):
+    """Add dates that left the window and drop dates past NEWS_ARCHIVE_RETENTION_DAYS
+    
+    The archive is rebuilt into a temp file and moved into place, so a crash leaves
+    the previous archive intact and no dead tables accumulate. Kept records are
+    copied as raw bytes (only date records are re-encoded with their new offsets).
+    Returns the number of dates added.
+    """
+    import struct
+    retention_days = NEWS_ARCHIVE_RETENTION_DAYS if retention_days is None else retention_days
+    cutoff = (get_kst_now() - timedelta(days=retention_days)).strftime('%Y-%m-%d') if retention_days > 0 else ''
+    
+    try:
+        archive = open_news_archive(path, strict=True)
+    except ValueError as e:
+        # Never recreate over an archive we failed to read; it needs a look by hand
+        log_message(f"  Skipping archive append: {e}")
+        return 0
+    
+    old_dates = archive.dates() if archive is not None else []
+    kept_dates = [date for date in old_dates if date >= cutoff]
+    new_entries = [d for d in date_entries if d['date'] not in set(old_dates) and d['date'] >= cutoff]
+    if not new_entries and len(kept_dates) == len(old_dates):
+        if archive is not None:
+            archive.close()
+        return 0
+    
+    entries = {}
+    meta = {'dates': [], 'articles': 0}
+    target = path + '.tmp'
+    try:
+        with open(target, 'w+b') as f:
+            f.write(b'\0' * struct.calcsize(ARCHIVE_HEADER))
+            
+            def write_payload(payload):
+                offset = f.tell()
+                f.write(struct.pack('<I', len(payload)))
+                f.write(payload)
+                return offset
+            
+            def write_date(date, update_time, offsets):
+                meta['dates'].append(date)
+                meta['articles'] += len(offsets)
+                return write_payload(json_dumps({'date': date, 'update_time': update_time,
+                                                 'offsets': offsets}).encode('utf-8'))
+            
+            if archive is not None:
+                moved = {}
+                for date in kept_dates:
+                    date_offset = archive._lookup(f'date:{date}')
+                    record = archive._record(date_offset)
+                    offsets = []
+                    for old in record['offsets']:
+                        moved[old] = write_payload(archive._payload(old))
+                        offsets.append(moved[old])
+                    moved[date_offset] = write_date(date, record.get('update_time', ''), offsets)
+                entries = {key_hash: moved[offset] for key_hash, offset in archive.table() if offset in moved}
+            
+            for date_entry in sorted(new_entries, key=lambda d: d['date']):
+                offsets = []
+                for news in date_entry.get('news', []):
+                    record = news.to_dict() if isinstance(news, Article) else dict(news)
+                    record['date'] = date_entry['date']
+                    offset = write_payload(json_dumps(record).encode('utf-8'))
+                    offsets.append(offset)
+                    if record.get('link'):
+                        entries[archive_key_hash(f"link:{record['link']}")] = offset
+                entries[archive_key_hash(f"date:{date_entry['date']}")] = write_date(
+                    date_entry['date'], date_entry.get('update_time', ''), offsets)
+            
+            slots = 16
+            while slots < len(entries) * 2:
+                slots *= 2
+            table = bytearray(slots * 16)
+            for key_hash, offset in entries.items():
+                slot = key_hash & (slots - 1)
+                while struct.unpack_from(ARCHIVE_SLOT, table, slot * 16)[0]:
+                    slot = (slot + 1) & (slots - 1)
+                struct.pack_into(ARCHIVE_SLOT, table, slot * 16, key_hash, offset)
+            table_offset = f.tell()
+            f.write(table)
+            
+            meta['dates'].sort()
+            meta_bytes = json_dumps(meta).encode('utf-8')
+            meta_offset = f.tell()
+            f.write(meta_bytes)
+            f.seek(0)
+            f.write(struct.pack(ARCHIVE_HEADER, ARCHIVE_MAGIC, ARCHIVE_VERSION, slots, table_offset,
+                                meta_offset, len(meta_bytes)))
+            f.flush()
+            os.fsync(f.fileno())
+    finally:
+        if archive is not None:
+            archive.close()
+    os.replace(target, path)
+    
+    pruned = len(old_dates) - len(kept_dates)
+    log_message(f"Archived {len(new_entries)} date(s) to {path}, pruned {pruned} "
+                f"({len(meta['dates'])} dates, {meta['articles']} articles total)")
+    return len(new_entries)
+
+def benchmark_json(scale=10, path=NEWS_JSON_PATH):
+    """Time serialize/parse of the stored dataset replicated `scale` times, per backend"""
+    data = load_all_news(path)
+    base_dates = data.get('dates', [])
+    if not base_dates:
+        log_message("No data to benchmark")
+        return
+    
+    dates = []
+    for copy_no in range(scale):
+        for date_entry in base_dates:
+            dates.append({'date': f"{date_entry['date']}#{copy_no}", 'update_time': date_entry.get('update_time', ''),
+                          'news': date_entry['news']})
+    serialized = serialize_news_data({'dates': dates, 'version': data.get('version', 0)})
+    article_count = sum(len(d['news']) for d in dates)
+    log_message(f"JSON benchmark: {article_count} articles ({scale}x stored data)")
+    
+    backends = ['json'] + [name for name, module in (('ujson', ujson), ('orjson', orjson)) if module]
+    for backend in backends:
+        for pretty in (False, True):
+            start = time.perf_counter()
+            text = json_dumps(serialized, pretty=pretty, backend=backend)
+            dump_time = time.perf_counter() - start
+            raw = text.encode('utf-8')
+            start = time.perf_counter()
+            json_loads(raw, backend=backend)
+            load_time = time.perf_counter() - start
+            log_message(f"  {backend:7s} {'pretty ' if pretty else 'compact'}: "
+                        f"dump {dump_time * 1000:7.1f} ms, load {load_time * 1000:7.1f} ms, "
+                        f"{len(raw) / 1024 / 1024:6.2f} MB")
+
+def maintain_10_day_window(data):
+    """Keep only the last 10 days of data"""
+    if len(data['dates']) <= 10:
+        return data
+    
+    sorted_dates = sorted(data['dates'], key=lambda x: x['date'], reverse=True)
+    data['dates'] = sorted_dates[:10]
+    return data
+
+def generate_html(all_data, base_path='', live_updates=True):
+    """Render the page for an in-memory dataset (already windowed), without touching disk
+    
+    base_path points at the site root (e.g. '../' for archive pages); live_updates=False
+    renders a frozen page that does not apply delta manifests.
+    """
+    all_news_flat = []
+    for date_entry in all_data['dates']:
+        for news in date_entry['news']:
+            all_news_flat.append(page_record(news, date_entry['date']))
     
     # 드롭다운 옵션 생성
     dates_options = ''.join(
@@ -874,8 +2840,10 @@ def generate_html(news_items):
     )
     
     # JSON 변환
-    all_news_by_date_json = json.dumps(all_news_by_date, ensure_ascii=False)
-    all_news_flat_json = json.dumps(all_news_flat, ensure_ascii=False)
+    all_news_flat_json = json_dumps(all_news_flat)
+    data_seq = all_data.get('version', 0)
+    archive_link = (f'<a class="search-btn" href="{base_path}archive/" title="지난 뉴스" aria-label="지난 뉴스">🗂️</a>'
+                    if ARCHIVE_RETENTION_DAYS > 0 else '')
     
     # HTML 템플릿 작성
     html = f'''<!DOCTYPE html>
@@ -884,6 +2852,9 @@ def generate_html(news_items):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
     <title>AI 뉴스 | 최신 소식</title>
+    <meta name="theme-color" content="#000000">
+    <link rel="manifest" href="{base_path}manifest.webmanifest">
+    <link rel="archives" href="{base_path}archive/">
     <style>
         @import url('https://fonts.googleapis.com/css2?family=Pretendard:wght@400;500;700&display=swap');
         
@@ -1137,6 +3108,10 @@ def generate_html(news_items):
             background: rgba(0,0,0,0.1);
         }}
 
+        .reel-img-container picture {{
+            display: contents;
+        }}
+        
         .reel-main-img {{
             width: 100%;
             height: 100%;
@@ -1327,6 +3302,92 @@ def generate_html(news_items):
             color: #FFFFFF;
         }}
         
+        .search-btn {{
+            margin-left: 10px;
+            font-size: 16px;
+            cursor: pointer;
+            opacity: 0.85;
+            color: inherit;
+            text-decoration: none;
+        }}
+        
+        .search-overlay {{
+            position: fixed;
+            inset: 0;
+            z-index: 3000;
+            background: rgba(0,0,0,0.92);
+            backdrop-filter: blur(20px);
+            display: none;
+            flex-direction: column;
+            padding: 16px;
+            max-width: 430px;
+            margin: 0 auto;
+        }}
+        
+        .search-overlay.open {{
+            display: flex;
+        }}
+        
+        .search-bar {{
+            display: flex;
+            gap: 8px;
+        }}
+        
+        .search-bar input {{
+            flex: 1;
+            height: 40px;
+            border-radius: 999px;
+            border: 1px solid rgba(255,255,255,0.15);
+            background: rgba(255,255,255,0.08);
+            color: #FFFFFF;
+            font-size: 15px;
+            padding: 0 16px;
+            outline: none;
+        }}
+        
+        .search-trends {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 8px;
+            margin-top: 12px;
+        }}
+        
+        .search-trend {{
+            font-size: 13px;
+            padding: 6px 12px;
+            border-radius: 999px;
+            background: rgba(255,255,255,0.12);
+            cursor: pointer;
+        }}
+        
+        .search-trend.rising {{
+            background: rgba(255,0,0,0.35);
+        }}
+        
+        .search-results {{
+            margin-top: 12px;
+            overflow-y: auto;
+            flex: 1;
+        }}
+        
+        .search-result {{
+            padding: 12px 4px;
+            border-bottom: 1px solid rgba(255,255,255,0.1);
+            cursor: pointer;
+        }}
+        
+        .search-result-title {{
+            font-size: 15px;
+            font-weight: 600;
+            line-height: 1.4;
+        }}
+        
+        .search-result-meta {{
+            font-size: 12px;
+            color: #9CA3AF;
+            margin-top: 4px;
+        }}
+        
         .header-capsule {{
             background: rgba(0,0,0,0.6);
             backdrop-filter: blur(20px);
@@ -1464,6 +3525,8 @@ def generate_html(news_items):
     <div class="top-ui">
         <div class="header-logo">
             <span class="logo-shorts">s</span><span class="logo-news">News</span>
+            <span class="search-btn" onclick="openSearch()">🔍</span>
+            {archive_link}
         </div>
         
         <div class="header-capsule" id="dateSelectWrapper">
@@ -1484,11 +3547,27 @@ def generate_html(news_items):
     <div class="reels-container" id="reelsContainer">
     </div>
     
+    <div class="search-overlay" id="searchOverlay">
+        <div class="search-bar">
+            <input id="searchInput" type="search" placeholder="기사 검색" autocomplete="off">
+            <div class="header-capsule"><div class="capsule-btn" onclick="closeSearch()">닫기</div></div>
+        </div>
+        <div class="search-trends" id="searchTrends"></div>
+        <div class="search-results" id="searchResults"></div>
+    </div>
+    
     <div class="nav-hint">
         위/아래로 스크롤
     </div>
     
     <script>
+        // Offline cache: shell and data served stale-while-revalidate by sw.js
+        if ('serviceWorker' in navigator) {{
+            window.addEventListener('load', () => {{
+                navigator.serviceWorker.register('{base_path}sw.js').catch(() => {{}});
+            }});
+        }}
+
         // Intro Animation Logic
         document.addEventListener('DOMContentLoaded', () => {{
             // 1. Typing animation runs via CSS (2s)
@@ -1513,7 +3592,8 @@ def generate_html(news_items):
             }}, 3800);
         }});
 
-        const allNewsFlat = {all_news_flat_json};
+        let allNewsFlat = {all_news_flat_json};
+        let dataSeq = {data_seq};
         
         const container = document.getElementById('reelsContainer');
         const progressFill = document.getElementById('progressFill');
@@ -1549,6 +3629,24 @@ def generate_html(news_items):
             container.scrollTop = 0;
         }}
         
+        // Mirrored images ('media/<hash>-<width>.<ext>') get a responsive <picture>;
+        // a .avif name means the WebP copies exist alongside as the fallback
+        const MIRROR_WIDTHS = {list(MIRROR_WIDTHS)};
+        const MEDIA_BASE = '{base_path}';
+        
+        function mirroredImage(image) {{
+            const match = /^media\\/([0-9a-f]+)-\\d+\\.(webp|avif)$/.exec(image);
+            if (!match) return null;
+            const [, digest, ext] = match;
+            const srcset = format => MIRROR_WIDTHS.map(w => `${{MEDIA_BASE}}media/${{digest}}-${{w}}.${{format}} ${{w}}w`).join(', ');
+            const webp = `${{MEDIA_BASE}}media/${{digest}}-${{MIRROR_WIDTHS[MIRROR_WIDTHS.length - 1]}}.webp`;
+            const avifSource = ext === 'avif' ? `<source type="image/avif" srcset="${{srcset('avif')}}" sizes="100vw">` : '';
+            return {{
+                small: `${{MEDIA_BASE}}media/${{digest}}-${{MIRROR_WIDTHS[0]}}.webp`,
+                picture: `<picture>${{avifSource}}<source type="image/webp" srcset="${{srcset('webp')}}" sizes="100vw"><img class="reel-main-img" src="${{webp}}" alt="News Image"></picture>`
+            }};
+        }}
+        
         function renderReels(newsItems, startIndex = 0) {{
             container.innerHTML = '';
             
@@ -1565,6 +3663,7 @@ def generate_html(news_items):
                 const bgImage = item.image 
                     ? item.image 
                     : defaultImages[(startIndex + index) % defaultImages.length];
+                const mirrored = mirroredImage(bgImage);
                 
                 const keywordTag = item.category_keyword ? `<span class="meta-separator">|</span><span class="reel-tag">#${{item.category_keyword}}</span>` : '';
                 const displayTitle = item.translated_title || item.title;
@@ -1577,9 +3676,9 @@ def generate_html(news_items):
                 summaryText = summaryText.replace(/•/g, '✔️');
                 
                 reel.innerHTML = `
-                    <div class="reel-bg-blur" style="background-image: url(${{bgImage}})"></div>
+                    <div class="reel-bg-blur" style="background-image: url(${{mirrored ? mirrored.small : bgImage}})"></div>
                     <div class="reel-img-container">
-                        <img class="reel-main-img" src="${{bgImage}}" alt="News Image">
+                        ${{mirrored ? mirrored.picture : `<img class="reel-main-img" src="${{bgImage}}" alt="News Image">`}}
                         <div class="reel-gradient-overlay"></div>
                     </div>
                     <div class="content-overlay">
@@ -1629,7 +3728,7 @@ def generate_html(news_items):
             }}
         }}
         
-        const allDates = [...new Set(allNewsFlat.filter(item => item.category !== 'AI Model').map(item => item.date))].sort().reverse();
+        let allDates = [...new Set(allNewsFlat.filter(item => item.category !== 'AI Model').map(item => item.date))].sort().reverse();
         let currentDateIndex = 0;
         
         function loadNextDate() {{
@@ -1676,6 +3775,217 @@ def generate_html(news_items):
             dateSelect.value = firstDate;
         }}
         
+        // Delta sync: a cached page catches up by applying only the per-run change manifests
+        function applyDelta(delta) {{
+            const byKey = new Map(allNewsFlat.map(item => [item.date + '|' + item.id, item]));
+            Object.entries(delta.dates).forEach(([date, change]) => {{
+                const rest = allNewsFlat.filter(item => item.date !== date);
+                if (change.dropped) {{
+                    allNewsFlat = rest;
+                    return;
+                }}
+                const updated = new Set(change.updated || []);
+                const items = change.order
+                    .map(id => (updated.has(id) && delta.articles[id]) || byKey.get(date + '|' + id) || delta.articles[id])
+                    .filter(Boolean)
+                    .map(item => Object.assign({{}}, item, {{ date: date }}));
+                allNewsFlat = rest.concat(items);
+            }});
+            allNewsFlat.sort((a, b) => b.date.localeCompare(a.date));
+        }}
+        
+        function refreshDates() {{
+            allDates = [...new Set(allNewsFlat.filter(item => item.category !== 'AI Model').map(item => item.date))].sort().reverse();
+            const selected = dateSelect.value;
+            dateSelect.innerHTML = allDates.map(date => `<option value="${{date}}">${{date.substring(5)}}</option>`).join('');
+            
+            // Only swap the visible reels if the reader has not started scrolling
+            if (currentIndex !== 0) {{
+                dateSelect.value = selected;
+                return;
+            }}
+            if (currentTab === 'news') {{
+                loadNewsForDate(allDates[0] || '');
+                dateSelect.value = allDates[0] || '';
+            }} else {{
+                switchTab('model');
+            }}
+        }}
+        
+        async function syncDeltas() {{
+            try {{
+                const latest = await fetch('{base_path}deltas/latest.json', {{ cache: 'no-cache' }}).then(r => r.json());
+                if (!latest || latest.seq <= dataSeq || dataSeq + 1 < latest.oldest_seq) return;
+                for (let seq = dataSeq + 1; seq <= latest.seq; seq++) {{
+                    const delta = await fetch(`{base_path}deltas/${{seq}}.json`).then(r => r.json());
+                    applyDelta(delta);
+                    dataSeq = seq;
+                }}
+                refreshDates();
+            }} catch (e) {{
+                // Offline or manifests unavailable: keep showing the embedded data
+            }}
+        }}
+        
+        const LIVE_UPDATES = {'true' if live_updates else 'false'};
+        if (LIVE_UPDATES) {{
+            syncDeltas();
+        }}
+        
+        // Search: static inverted index sharded by term hash, shards fetched on demand
+        const SEARCH_BASE = '{base_path}{SEARCH_DIR}/';
+        const searchOverlay = document.getElementById('searchOverlay');
+        const searchInput = document.getElementById('searchInput');
+        const searchResults = document.getElementById('searchResults');
+        let searchMeta = null;
+        const searchShards = new Map();
+        const searchDocBlocks = new Map();
+        let searchTimer = null;
+        
+        function searchTokens(text) {{
+            text = text.toLowerCase();
+            const tokens = text.match(/[a-z0-9]{{2,}}/g) || [];
+            (text.match(/[가-힣]{{2,}}/g) || []).forEach(run => {{
+                for (let i = 0; i < run.length - 1; i++) tokens.push(run.substr(i, 2));
+            }});
+            return [...new Set(tokens)];
+        }}
+        
+        function searchShardOf(term) {{
+            // FNV-1a over UTF-16 code units, mirrored by search_shard() in update_news.py
+            let h = 0x811c9dc5;
+            for (let i = 0; i < term.length; i++) {{
+                h ^= term.charCodeAt(i);
+                h = Math.imul(h, 0x01000193) >>> 0;
+            }}
+            return h % searchMeta.shards;
+        }}
+        
+        function searchFetch(cache, key, name) {{
+            if (!cache.has(key)) {{
+                cache.set(key, fetch(`${{SEARCH_BASE}}${{name}}?v=${{searchMeta.version}}`).then(r => r.json()));
+            }}
+            return cache.get(key);
+        }}
+        
+        async function runSearch(query) {{
+            if (!searchMeta) {{
+                searchMeta = await fetch(SEARCH_BASE + 'meta.json', {{ cache: 'no-cache' }}).then(r => r.json());
+            }}
+            const terms = searchTokens(query);
+            if (terms.length === 0) return [];
+            const scores = new Map();
+            await Promise.all(terms.map(async term => {{
+                const shard = searchShardOf(term);
+                const postings = (await searchFetch(searchShards, shard, `terms-${{shard}}.json`))[term];
+                if (!postings) return;
+                const idf = Math.log(1 + searchMeta.docs / (postings.length / 2));
+                for (let i = 0; i < postings.length; i += 2) {{
+                    const hit = scores.get(postings[i]) || {{ matched: 0, score: 0 }};
+                    hit.matched++;
+                    hit.score += postings[i + 1] * idf;
+                    scores.set(postings[i], hit);
+                }}
+            }}));
+            const top = [...scores.entries()]
+                .sort((a, b) => b[1].matched - a[1].matched || b[1].score - a[1].score || a[0] - b[0])
+                .slice(0, 30);
+            return Promise.all(top.map(async ([doc]) => {{
+                const block = Math.floor(doc / searchMeta.block_size);
+                const docs = await searchFetch(searchDocBlocks, block, `docs-${{block}}.json`);
+                return docs[doc % searchMeta.block_size];
+            }}));
+        }}
+        
+        function renderSearchResults(docs) {{
+            searchResults.innerHTML = '';
+            docs.forEach(doc => {{
+                const [date, id, title, source, category, link] = doc;
+                const row = document.createElement('div');
+                row.className = 'search-result';
+                const titleEl = document.createElement('div');
+                titleEl.className = 'search-result-title';
+                titleEl.textContent = title;
+                const metaEl = document.createElement('div');
+                metaEl.className = 'search-result-meta';
+                metaEl.textContent = `${{source}} | ${{date}}${{category === 'AI Model' ? ' | AI Model' : ''}}`;
+                row.appendChild(titleEl);
+                row.appendChild(metaEl);
+                row.addEventListener('click', () => openSearchResult(doc));
+                searchResults.appendChild(row);
+            }});
+            if (docs.length === 0 && searchInput.value.trim()) {{
+                searchResults.innerHTML = '<div class="search-result-meta">검색 결과가 없습니다.</div>';
+            }}
+        }}
+        
+        function openSearchResult(doc) {{
+            const [date, id, , , category, link] = doc;
+            const inWindow = allNewsFlat.some(item => item.id === id && item.date === date);
+            if (!inWindow) {{
+                window.open(link, '_blank');
+                return;
+            }}
+            closeSearch();
+            if (category === 'AI Model') {{
+                switchTab('model');
+            }} else {{
+                if (currentTab !== 'news') switchTab('news');
+                dateSelect.value = date;
+                loadNewsForDate(date);
+            }}
+            const index = currentData.findIndex(item => item.id === id);
+            if (index >= 0) {{
+                currentIndex = index;
+                container.scrollTop = index * window.innerHeight;
+                updateProgress();
+            }}
+        }}
+        
+        let trendsLoaded = false;
+        
+        function loadTrends() {{
+            if (trendsLoaded) return;
+            trendsLoaded = true;
+            fetch('{base_path}trends.json', {{ cache: 'no-cache' }}).then(r => r.json()).then(trends => {{
+                const box = document.getElementById('searchTrends');
+                const rising = new Set(trends.rising.map(([keyword]) => keyword));
+                const keywords = [...rising, ...trends.top.map(([keyword]) => keyword).filter(k => !rising.has(k))].slice(0, 12);
+                keywords.forEach(keyword => {{
+                    const chip = document.createElement('span');
+                    chip.className = rising.has(keyword) ? 'search-trend rising' : 'search-trend';
+                    chip.textContent = '#' + keyword;
+                    chip.addEventListener('click', () => {{
+                        searchInput.value = keyword;
+                        searchInput.dispatchEvent(new Event('input'));
+                    }});
+                    box.appendChild(chip);
+                }});
+            }}).catch(() => {{ trendsLoaded = false; }});
+        }}
+        
+        function openSearch() {{
+            searchOverlay.classList.add('open');
+            searchInput.focus();
+            loadTrends();
+        }}
+        
+        function closeSearch() {{
+            searchOverlay.classList.remove('open');
+        }}
+        
+        searchInput.addEventListener('input', () => {{
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(() => {{
+                const query = searchInput.value;
+                runSearch(query)
+                    .then(docs => {{ if (searchInput.value === query) renderSearchResults(docs); }})
+                    .catch(() => {{
+                        searchResults.innerHTML = '<div class="search-result-meta">검색 색인을 불러오지 못했습니다.</div>';
+                    }});
+            }}, 150);
+        }});
+        
         let touchStartY = 0;
         let isAtLastItem = false;
         
@@ -1708,116 +4018,1057 @@ def generate_html(news_items):
     
     return html
 
-if __name__ == '__main__':
+# ============================================================
+# Delta Data Feed (per-run change manifests)
+# ============================================================
+
+DELTA_DIR = 'deltas'
+DELTA_RETENTION = 64                     # ~8 days of 3-hourly runs
+
+def article_id(link):
+    """Stable short id for an article, derived from its link"""
+    return hashlib.sha1((link or '').encode('utf-8')).hexdigest()[:12]
+
+def page_record(news, date):
+    """Article as shipped to the page: only the rendered fields plus its date and id"""
+    record = {key: news[key] for key in PAGE_FIELDS if news.get(key) is not None}
+    record['date'] = date
+    record['id'] = article_id(news.get('link', ''))
+    return record
+
+def page_hashes(dates):
+    """date -> {article id: hash of its page record}, stored with the dataset
+    
+    Articles are edited in place (image replacement, mirroring, re-summarized models),
+    so the previous window's objects cannot be compared; these hashes can.
+    """
+    return {
+        date_entry['date']: {
+            record['id']: hashlib.sha1(json_dumps(record).encode('utf-8')).hexdigest()[:12]
+            for record in (page_record(news, date_entry['date']) for news in date_entry.get('news', []))
+        }
+        for date_entry in dates
+    }
+
+def build_change_manifest(prev_dates, new_dates, seq, prev_hashes=None, new_hashes=None):
+    """Diff two rolling windows into a change manifest, or None when nothing changed
+    
+    For every touched date it lists added, removed and updated ids plus the full id
+    order, so a client can rebuild the date exactly. Added and updated articles are
+    shipped in 'articles'; updates are detected from the page_hashes of both windows.
+    """
+    prev_ids = {d['date']: [article_id(n.get('link', '')) for n in d.get('news', [])] for d in prev_dates}
+    prev_hashes = prev_hashes or {}
+    new_hashes = new_hashes or {}
+    changes = {}
+    articles = {}
+    
+    for date_entry in new_dates:
+        date = date_entry['date']
+        old_ids = set(prev_ids.get(date, []))
+        old_hashes = prev_hashes.get(date, {})
+        order = []
+        added = []
+        updated = []
+        for news in date_entry.get('news', []):
+            aid = article_id(news.get('link', ''))
+            order.append(aid)
+            if aid not in old_ids:
+                added.append(aid)
+                articles[aid] = page_record(news, date)
+            elif aid in old_hashes and old_hashes[aid] != new_hashes.get(date, {}).get(aid, old_hashes[aid]):
+                updated.append(aid)
+                articles[aid] = page_record(news, date)
+        new_ids = set(order)
+        removed = [aid for aid in prev_ids.get(date, []) if aid not in new_ids]
+        if added or removed or updated:
+            changes[date] = {
+                'update_time': date_entry.get('update_time', ''),
+                'added': added,
+                'removed': removed,
+                'updated': updated,
+                'order': order
+            }
+    
+    current_dates = {d['date'] for d in new_dates}
+    for date, ids in prev_ids.items():
+        if date not in current_dates:
+            changes[date] = {'added': [], 'removed': ids, 'dropped': True}
+    
+    if not changes:
+        return None
+    return {
+        'seq': seq,
+        'prev_seq': seq - 1,
+        'generated_at': get_kst_timestamp(),
+        'dates': changes,
+        'articles': articles
+    }
+
+def write_change_manifest(manifest):
+    """Write deltas/<seq>.json, refresh deltas/latest.json and prune old manifests"""
+    os.makedirs(DELTA_DIR, exist_ok=True)
+    seq = manifest['seq']
+    with open(os.path.join(DELTA_DIR, f'{seq}.json'), 'w', encoding='utf-8') as f:
+        f.write(json_dumps(manifest))
+    
+    oldest_seq = max(1, seq - DELTA_RETENTION + 1)
+    for name in os.listdir(DELTA_DIR):
+        stem = name[:-len('.json')] if name.endswith('.json') else ''
+        if stem.isdigit() and int(stem) < oldest_seq:
+            os.remove(os.path.join(DELTA_DIR, name))
+    
+    latest = {'seq': seq, 'oldest_seq': oldest_seq, 'generated_at': manifest['generated_at']}
+    with open(os.path.join(DELTA_DIR, 'latest.json'), 'w', encoding='utf-8') as f:
+        f.write(json_dumps(latest))
+
+# ============================================================
+# Archive Renderer (per-date pages, process pool)
+# ============================================================
+
+ARCHIVE_DIR = 'archive'
+ARCHIVE_RETENTION_DAYS = int(os.getenv('ARCHIVE_RETENTION_DAYS', 90))
+ARCHIVE_INDEX_PAGE_SIZE = 30             # dates per archive index page
+
+def write_text_if_changed(path, text):
+    """Write text to path unless it already holds exactly that; True when written"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return True
+
+def archive_chunk(date_entry):
+    """Page-ready data for one date, also used as its archive/data/<date>.json chunk"""
+    return {
+        'date': date_entry['date'],
+        'update_time': date_entry.get('update_time', ''),
+        'news': [page_record(news, date_entry['date']) for news in date_entry.get('news', [])]
+    }
+
+def render_archive_date(chunk):
+    """Process-pool worker: render one date's frozen page into archive/<date>.html"""
+    html = generate_html({'dates': [chunk]}, base_path='../', live_updates=False)
+    with open(os.path.join(ARCHIVE_DIR, f"{chunk['date']}.html"), 'w', encoding='utf-8') as f:
+        f.write(html)
+    return chunk['date']
+
+def load_archive_summary():
+    try:
+        with open(os.path.join(ARCHIVE_DIR, 'data', 'index.json'), 'rb') as f:
+            return json_loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def generate_archive_index_page(dates, summary, page, page_count):
+    """One page of the paginated archive index (newest dates first)"""
+    rows = ''.join(
+        f'<li><a href="{date}.html"><span class="date">{date}</span>'
+        f'<span class="count">{summary[date]["count"]}건</span></a></li>'
+        for date in dates
+    )
+    prev_link = '' if page == 1 else f'<a href="{"index" if page == 2 else f"page-{page - 1}"}.html">&lt; 최근</a>'
+    next_link = '' if page >= page_count else f'<a href="page-{page + 1}.html">이전 &gt;</a>'
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>AI 뉴스 아카이브 ({page}/{page_count})</title>
+    <style>
+        body {{ background: #000000; color: #FFFFFF; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; max-width: 430px; margin: 0 auto; padding: 24px; }}
+        h1 {{ font-family: 'Courier New', Courier, monospace; font-size: 20px; }}
+        h1 a {{ color: #FFFFFF; text-decoration: none; }}
+        h1 .logo-shorts {{ color: #FF0000; }}
+        ul {{ list-style: none; padding: 0; }}
+        li a {{ display: flex; justify-content: space-between; padding: 14px 4px; border-bottom: 1px solid rgba(255,255,255,0.1); color: #FFFFFF; text-decoration: none; }}
+        .count {{ color: #9CA3AF; font-size: 13px; }}
+        nav {{ display: flex; justify-content: space-between; margin-top: 20px; }}
+        nav a {{ color: #3B82F6; text-decoration: none; }}
+    </style>
+</head>
+<body>
+    <h1><a href="../"><span class="logo-shorts">s</span>News</a> 아카이브</h1>
+    <ul>{rows}</ul>
+    <nav><span>{prev_link}</span><span>{next_link}</span></nav>
+</body>
+</html>"""
+
+def render_archive(all_data, force=False, max_workers=None):
+    """Render per-date archive pages in parallel and rebuild the paginated index
+    
+    Only dates whose data chunk changed are rendered, so each run costs roughly the
+    same no matter how much history is retained. Dates older than
+    ARCHIVE_RETENTION_DAYS are pruned.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    data_dir = os.path.join(ARCHIVE_DIR, 'data')
+    os.makedirs(data_dir, exist_ok=True)
+    summary = load_archive_summary()
+    
+    changed = []
+    for date_entry in all_data.get('dates', []):
+        chunk = archive_chunk(date_entry)
+        text = json_dumps(chunk)
+        chunk_path = os.path.join(data_dir, f"{chunk['date']}.json")
+        html_path = os.path.join(ARCHIVE_DIR, f"{chunk['date']}.html")
+        if not write_text_if_changed(chunk_path, text) and not force and os.path.exists(html_path):
+            continue
+        summary[chunk['date']] = {'count': len(chunk['news']), 'update_time': chunk['update_time']}
+        changed.append(chunk)
+    
+    if force:
+        # Template changes: re-render retained dates that are no longer in the window
+        window_dates = {chunk['date'] for chunk in changed}
+        for date in list(summary):
+            if date in window_dates:
+                continue
+            try:
+                with open(os.path.join(data_dir, f'{date}.json'), 'rb') as f:
+                    changed.append(json_loads(f.read()))
+            except (FileNotFoundError, ValueError):
+                # No chunk to render from: drop the date rather than link to a stale page
+                log_message(f"  Archive: missing or unreadable chunk for {date}, dropping it")
+                del summary[date]
+                html_path = os.path.join(ARCHIVE_DIR, f'{date}.html')
+                if os.path.exists(html_path):
+                    os.remove(html_path)
+    
+    cutoff = (get_kst_now() - timedelta(days=ARCHIVE_RETENTION_DAYS)).strftime('%Y-%m-%d')
+    for date in [d for d in summary if d < cutoff]:
+        del summary[date]
+        for path in (os.path.join(data_dir, f'{date}.json'), os.path.join(ARCHIVE_DIR, f'{date}.html')):
+            if os.path.exists(path):
+                os.remove(path)
+    changed = [chunk for chunk in changed if chunk['date'] >= cutoff]
+    
+    if len(changed) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(render_archive_date, changed))
+    elif changed:
+        render_archive_date(changed[0])
+    
+    with open(os.path.join(data_dir, 'index.json'), 'w', encoding='utf-8') as f:
+        f.write(json_dumps(summary))
+    
+    dates = sorted(summary, reverse=True)
+    page_count = max(1, -(-len(dates) // ARCHIVE_INDEX_PAGE_SIZE))
+    for page in range(1, page_count + 1):
+        page_dates = dates[(page - 1) * ARCHIVE_INDEX_PAGE_SIZE:page * ARCHIVE_INDEX_PAGE_SIZE]
+        name = 'index.html' if page == 1 else f'page-{page}.html'
+        with open(os.path.join(ARCHIVE_DIR, name), 'w', encoding='utf-8') as f:
+            f.write(generate_archive_index_page(page_dates, summary, page, page_count))
+    for name in os.listdir(ARCHIVE_DIR):
+        match = re.match(r'page-(\d+)\.html$', name)
+        if match and int(match.group(1)) > page_count:
+            os.remove(os.path.join(ARCHIVE_DIR, name))
+    
+    log_message(f"Archive: rendered {len(changed)} date(s), {len(dates)} retained across {page_count} index page(s)")
+
+# ============================================================
+# Search Index (sharded static inverted index)
+# ============================================================
+
+SEARCH_DIR = 'search'
+SEARCH_SHARDS = 32
+SEARCH_DOC_BLOCK = 500                   # documents per lazily loaded docs-<n>.json
+SEARCH_FIELD_WEIGHTS = (('title', 3), ('category_keyword', 2), ('summary', 1))
+
+def search_shard(term, shards=SEARCH_SHARDS):
+    """FNV-1a over UTF-16 code units, so the page can find a term's shard itself"""
+    h = 0x811c9dc5
+    data = term.encode('utf-16-le')
+    for i in range(0, len(data), 2):
+        h ^= data[i] | (data[i + 1] << 8)
+        h = (h * 0x01000193) & 0xffffffff
+    return h % shards
+
+def search_documents(all_data):
+    """Page records for the window plus retained archive dates, newest first"""
+    chunks = {d['date']: archive_chunk(d) for d in all_data.get('dates', [])}
+    if ARCHIVE_RETENTION_DAYS > 0:
+        news_archive = open_news_archive()
+        for date in load_archive_summary():
+            if date in chunks:
+                continue
+            date_entry = news_archive.get_date(date) if news_archive else None
+            if date_entry:
+                chunks[date] = archive_chunk(date_entry)
+                continue
+            try:
+                with open(os.path.join(ARCHIVE_DIR, 'data', f'{date}.json'), 'rb') as f:
+                    chunks[date] = json_loads(f.read())
+            except (FileNotFoundError, ValueError):
+                continue
+        if news_archive:
+            news_archive.close()
+    
+    docs = []
+    seen = set()
+    for date in sorted(chunks, reverse=True):
+        for record in chunks[date].get('news', []):
+            key = (date, record.get('id'))
+            if key not in seen:
+                seen.add(key)
+                docs.append(record)
+    return docs
+
+def build_search_index(all_data):
+    """Write search/meta.json, terms-<shard>.json postings and docs-<block>.json
+    
+    Postings are flat [doc, weight, doc, weight, ...] lists, weighted by the field a
+    term appears in, over the same English-word and Hangul-bigram tokens used by the
+    pre-ranker. Only files whose content changed are rewritten.
+    """
+    from collections import defaultdict
+    
+    docs = search_documents(all_data)
+    shards = [defaultdict(list) for _ in range(SEARCH_SHARDS)]
+    for doc_id, record in enumerate(docs):
+        weights = defaultdict(int)
+        for field, weight in SEARCH_FIELD_WEIGHTS:
+            for term in tokenize_text(record.get(field, '')):
+                weights[term] += weight
+        for term, weight in weights.items():
+            shards[search_shard(term)][term].extend((doc_id, weight))
+    
+    os.makedirs(SEARCH_DIR, exist_ok=True)
+    texts = {f'terms-{i}.json': json_dumps(dict(shard)) for i, shard in enumerate(shards)}
+    for block in range(0, max(len(docs), 1), SEARCH_DOC_BLOCK):
+        texts[f'docs-{block // SEARCH_DOC_BLOCK}.json'] = json_dumps([
+            [r['date'], r['id'], r.get('title', ''), r.get('source', ''), r.get('category', ''), r.get('link', '')]
+            for r in docs[block:block + SEARCH_DOC_BLOCK]
+        ])
+    
+    written = sum(write_text_if_changed(os.path.join(SEARCH_DIR, name), text) for name, text in texts.items())
+    for name in os.listdir(SEARCH_DIR):
+        if name.endswith('.json') and name != 'meta.json' and name not in texts:
+            os.remove(os.path.join(SEARCH_DIR, name))
+    
+    version = hashlib.sha1(''.join(texts[name] for name in sorted(texts)).encode('utf-8')).hexdigest()[:12]
+    meta = {'version': version, 'shards': SEARCH_SHARDS, 'docs': len(docs), 'block_size': SEARCH_DOC_BLOCK}
+    write_text_if_changed(os.path.join(SEARCH_DIR, 'meta.json'), json_dumps(meta))
+    
+    terms = sum(len(shard) for shard in shards)
+    log_message(f"Search index: {len(docs)} docs, {terms} terms, {written} file(s) updated")
+
+# ============================================================
+# Trending Keywords (incremental per-day / per-source counters)
+# ============================================================
+
+TRENDS_STATE_PATH = 'trends_state.json'
+TRENDS_PATH = 'trends.json'
+TRENDS_TOP = 15
+TRENDS_MIN_HOT = 2                       # today's mentions needed to count as rising
+
+def normalize_keyword(keyword):
+    return re.sub(r'\s+', ' ', (keyword or '').strip().lstrip('#')).strip()
+
+def trend_entries(date_entry):
+    """(id, keyword, source) for each news article of a date that carries a keyword"""
+    entries = set()
+    for news in date_entry.get('news', []):
+        keyword = normalize_keyword(news.get('category_keyword'))
+        if keyword and news.get('category') != 'AI Model':
+            entries.add((article_id(news.get('link', '')), keyword, news.get('source', '')))
+    return entries
+
+def trend_signature(entries):
+    return hashlib.sha1(json_dumps(sorted(entries)).encode('utf-8')).hexdigest()[:16]
+
+def load_trends_state():
     try:
-        log_message("=" * 50)
-        log_message("AI News Shorts - Batch Processing Started")
-        log_message("=" * 50)
+        with open(TRENDS_STATE_PATH, 'rb') as f:
+            return json_loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return {'days': {}}
+
+def update_trend_counts(state, prev_dates, new_dates):
+    """Apply only the articles added to or removed from each date since the last run
+    
+    Each day stores a signature of the entries it was last built from. When that does
+    not match prev_dates (a crashed run, a stage run on its own, a hand-edited file)
+    or the state has not seen the date yet, the day is recounted in full; dates that
+    left the window are dropped, so the counters always cover exactly the window.
+    """
+    days = state.setdefault('days', {})
+    prev_by_date = {d['date']: d for d in prev_dates}
+    new_by_date = {d['date']: d for d in new_dates}
+    
+    for date in [d for d in days if d not in new_by_date]:
+        del days[date]
+    
+    changed = 0
+    for date, date_entry in new_by_date.items():
+        new_entries = trend_entries(date_entry)
+        old_entries = trend_entries(prev_by_date[date]) if date in prev_by_date else set()
+        if date not in days or days[date].get('signature') != trend_signature(old_entries):
+            days[date] = {'keywords': {}, 'sources': {}}
+            old_entries = set()
+        day = days[date]
+        day['signature'] = trend_signature(new_entries)
         
-        all_data = load_all_news()
-        existing_dates = {d['date']: d for d in all_data.get('dates', [])}
+        for entries, step in ((new_entries - old_entries, 1), (old_entries - new_entries, -1)):
+            for _, keyword, source in entries:
+                changed += 1
+                day['keywords'][keyword] = day['keywords'].get(keyword, 0) + step
+                if day['keywords'][keyword] <= 0:
+                    del day['keywords'][keyword]
+                by_source = day['sources'].setdefault(source, {})
+                by_source[keyword] = by_source.get(keyword, 0) + step
+                if by_source[keyword] <= 0:
+                    del by_source[keyword]
+                    if not by_source:
+                        del day['sources'][source]
+    return changed
+
+def build_trends(state, top=TRENDS_TOP):
+    """Small page-facing summary: window totals, rising keywords, per-day and per-source tops"""
+    from collections import Counter
+    days = state.get('days', {})
+    dates = sorted(days, reverse=True)
+    if not dates:
+        return {'updated': get_kst_now().strftime('%Y-%m-%d %H:%M:%S'), 'dates': [], 'top': [], 'rising': [], 'daily': {}, 'by_source': {}}
+    
+    totals = Counter()
+    by_source = {}
+    for date in dates:
+        totals.update(days[date]['keywords'])
+        for source, counts in days[date]['sources'].items():
+            by_source.setdefault(source, Counter()).update(counts)
+    
+    latest = days[dates[0]]['keywords']
+    baseline_days = max(len(dates) - 1, 1)
+    rising = []
+    for keyword, count in latest.items():
+        if count < TRENDS_MIN_HOT:
+            continue
+        baseline = (totals[keyword] - count) / baseline_days
+        ratio = (count + 1) / (baseline + 1)
+        if ratio > 1:
+            rising.append([keyword, count, round(ratio, 2)])
+    rising.sort(key=lambda x: (-x[2], -x[1], x[0]))
+    
+    return {
+        'updated': get_kst_now().strftime('%Y-%m-%d %H:%M:%S'),
+        'dates': dates,
+        'top': [[k, c] for k, c in sorted(totals.items(), key=lambda x: (-x[1], x[0]))[:top]],
+        'rising': rising[:10],
+        'daily': {date: [[k, c] for k, c in Counter(days[date]['keywords']).most_common(5)] for date in dates},
+        'by_source': {source: [[k, c] for k, c in counts.most_common(5)] for source, counts in sorted(by_source.items())}
+    }
+
+def update_trends(prev_dates, new_dates):
+    state = load_trends_state()
+    changed = update_trend_counts(state, prev_dates, new_dates)
+    with open(TRENDS_STATE_PATH, 'w', encoding='utf-8') as f:
+        f.write(json_dumps(state))
+    trends = build_trends(state)
+    with open(TRENDS_PATH, 'w', encoding='utf-8') as f:
+        f.write(json_dumps(trends))
+    hot = ', '.join(k for k, _, _ in trends['rising'][:3]) or '-'
+    log_message(f"Trends: {changed} keyword update(s), rising: {hot}")
+
+# ============================================================
+# Offline Shell: Service Worker + Web Manifest
+# ============================================================
+
+def generate_service_worker(version):
+    """Service worker that precaches the page shell and serves it stale-while-revalidate
+    
+    version changes every run, so the browser installs the new worker (and drops the
+    previous shell cache) as soon as the 3-hourly update lands. In the meantime the
+    stale page catches up through deltas/, which is fetched network-first for
+    latest.json and cache-first for the immutable per-run manifests. The runtime
+    cache (deltas, search shards, media) is versioned the same way, so a new worker
+    drops everything the previous build cached instead of letting it pile up.
+    """
+    return f"""// Generated by update_news.py - do not edit
+const CACHE_VERSION = '{version}';
+const SHELL_CACHE = 'ainews-shell-' + CACHE_VERSION;
+const RUNTIME_CACHE = 'ainews-runtime-' + CACHE_VERSION;
+const FONT_CACHE = 'ainews-fonts';
+const SHELL_URLS = ['./', './index.html', './manifest.webmanifest'];
+
+self.addEventListener('install', event => {{
+    event.waitUntil(
+        caches.open(SHELL_CACHE)
+            .then(cache => cache.addAll(SHELL_URLS))
+            .then(() => self.skipWaiting())
+    );
+}});
+
+self.addEventListener('activate', event => {{
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(keys
+                .filter(key => (key.startsWith('ainews-shell-') || key.startsWith('ainews-runtime'))
+                    && key !== SHELL_CACHE && key !== RUNTIME_CACHE)
+                .map(key => caches.delete(key))))
+            .then(() => self.clients.claim())
+    );
+}});
+
+function staleWhileRevalidate(request, cacheName) {{
+    return caches.open(cacheName).then(cache =>
+        cache.match(request, {{ ignoreSearch: true }}).then(cached => {{
+            const network = fetch(request)
+                .then(response => {{
+                    if (response.ok) cache.put(request, response.clone());
+                    return response;
+                }})
+                .catch(() => cached);
+            return cached || network;
+        }})
+    );
+}}
+
+function networkFirst(request, cacheName) {{
+    return caches.open(cacheName).then(cache =>
+        fetch(request)
+            .then(response => {{
+                if (response.ok) cache.put(request, response.clone());
+                return response;
+            }})
+            .catch(() => cache.match(request))
+    );
+}}
+
+function cacheFirst(request, cacheName) {{
+    return caches.open(cacheName).then(cache =>
+        cache.match(request).then(cached => cached || fetch(request).then(response => {{
+            if (response.ok || response.type === 'opaque') cache.put(request, response.clone());
+            return response;
+        }}))
+    );
+}}
+
+self.addEventListener('fetch', event => {{
+    const request = event.request;
+    if (request.method !== 'GET') return;
+    const url = new URL(request.url);
+
+    if (request.mode === 'navigate') {{
+        event.respondWith(staleWhileRevalidate(request, SHELL_CACHE));
+    }} else if (url.hostname === 'fonts.googleapis.com' || url.hostname === 'fonts.gstatic.com') {{
+        event.respondWith(cacheFirst(request, FONT_CACHE));
+    }} else if (url.origin === self.location.origin && url.pathname.endsWith('/deltas/latest.json')) {{
+        event.respondWith(networkFirst(request, RUNTIME_CACHE));
+    }} else if (url.origin === self.location.origin && url.pathname.includes('/deltas/')) {{
+        // Change manifests never change once written
+        event.respondWith(cacheFirst(request, RUNTIME_CACHE));
+    }} else if (url.origin === self.location.origin && url.pathname.includes('/media/')) {{
+        // Mirrored images are named by content hash
+        event.respondWith(cacheFirst(request, RUNTIME_CACHE));
+    }} else if (url.origin === self.location.origin && url.pathname.endsWith('/search/meta.json')) {{
+        event.respondWith(networkFirst(request, RUNTIME_CACHE));
+    }} else if (url.origin === self.location.origin && url.pathname.includes('/search/')) {{
+        // Shards are requested with ?v=<index version>, so each URL is immutable
+        event.respondWith(cacheFirst(request, RUNTIME_CACHE));
+    }} else if (url.origin === self.location.origin) {{
+        event.respondWith(staleWhileRevalidate(request, RUNTIME_CACHE));
+    }}
+}});
+"""
+
+def generate_web_manifest():
+    manifest = {
+        'name': 'AI 뉴스 | sNews',
+        'short_name': 'sNews',
+        'lang': 'ko',
+        'start_url': './',
+        'scope': './',
+        'display': 'standalone',
+        'background_color': '#000000',
+        'theme_color': '#000000'
+    }
+    return json.dumps(manifest, ensure_ascii=False, indent=2)
+
+def collect_existing_links(all_data):
+    """Collect every article link already stored in the rolling window"""
+    existing_links = set()
+    for date_entry in all_data.get('dates', []):
+        for news in date_entry.get('news', []):
+            if news.get('link'):
+                existing_links.add(news['link'])
+    return existing_links
+
+def collect_window_articles(all_data):
+    """Every stored news article (AI Models excluded), used as the ranking corpus"""
+    return [news for date_entry in all_data.get('dates', []) for news in date_entry.get('news', [])
+            if news.get('category') != 'AI Model']
+
+def collect_models_cache(all_data):
+    """Map model link -> stored model entry for reusing existing summaries"""
+    existing_models_cache = {}
+    for date_entry in all_data.get('dates', []):
+        for news in date_entry.get('news', []):
+            if news.get('category') == 'AI Model' and news.get('link'):
+                existing_models_cache[news['link']] = news
+    return existing_models_cache
+
+def process_new_articles(news_items, corpus_articles=None, stored_dates=None):
+    """Curate, summarize and crawl images for freshly collected articles
+    
+    og:image crawling runs in a small thread pool fed by batch_summarize, so each
+    article's page is fetched while the rest of its batch is still generating.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    log_message("  Curating news (novelty against today's selection, daily quota)...")
+    with stage_deadline('curation'):
+        news_items = curate_news_list(news_items, corpus_articles, stored_dates)
+    
+    for item in news_items:
+        item['original_title'] = item.get('title', '')
+        item['original_summary'] = item.get('description', '')[:300]
+    
+    image_jobs = {}
+    
+    with stage_deadline('summarize'), ThreadPoolExecutor(max_workers=4) as executor:
+        def resolve_image(item):
+            if id(item) in image_jobs or not item.get('link') or item.get('image'):
+                return
+            if item.get('source', '') in ['Google News']:
+                return
+            image_jobs[id(item)] = (item, executor.submit(fetch_article_image, item['link'], None))
         
-        existing_links = set()
-        for date_entry in all_data.get('dates', []):
-            for news in date_entry.get('news', []):
-                if news.get('link'):
-                    existing_links.add(news['link'])
+        log_message("  Batch summarizing curated articles (token-aware batches, crawling og:image alongside)...")
+        news_items = batch_summarize(news_items, on_article=resolve_image)
         
-        today = get_kst_today()
+        # Articles that fell back to their raw description still need an image
+        for item in news_items:
+            resolve_image(item)
         
-        log_message(f"\nFetching news for {today}...")
+        for item, future in image_jobs.values():
+            item['image'] = future.result()
+    
+    return news_items
+
+def merge_news_into_dates(existing_dates, news_items, today):
+    """Prepend new articles to their date entries, returns number of dates touched"""
+    from collections import defaultdict
+    news_by_date = defaultdict(list)
+    for item in news_items:
+        item_date = item.get('date', today)
+        news_by_date[item_date].append(item)
+    
+    for news_date, date_news_items in news_by_date.items():
+        existing_date_news = existing_dates.get(news_date, {}).get('news', [])
+        # Only filter out AI Models for TODAY (they get re-added by HuggingFace processing)
+        # Preserve AI Models on past dates
+        if news_date == today:
+            existing_date_news_filtered = [n for n in existing_date_news if n.get('category') != 'AI Model']
+        else:
+            existing_date_news_filtered = existing_date_news
+        combined_news = date_news_items + existing_date_news_filtered
         
-        news_items = fetch_all_news_for_date(today, existing_links, include_yesterday=True)
-        log_message(f"  Total collected: {len(news_items)} articles")
+        existing_dates[news_date] = {
+            'date': news_date,
+            'update_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'news': combined_news
+        }
+        log_message(f"  Added {len(date_news_items)} articles to {news_date}")
+    
+    return len(news_by_date)
+
+def merge_models_into_today(existing_dates, hf_models, today):
+    """Replace today's AI Model entries with the latest trending models"""
+    existing_today_entry = existing_dates.get(today, {'date': today, 'update_time': '', 'news': []})
+    existing_news = [n for n in existing_today_entry.get('news', []) if n.get('category') != 'AI Model']
+    combined_news = existing_news + hf_models
+    
+    existing_dates[today] = {
+        'date': today,
+        'update_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'news': combined_news
+    }
+    log_message(f"  Added {len(hf_models)} HuggingFace models to today's feed")
+
+def render_site(all_data):
+    """Write index.html, sw.js and manifest.webmanifest for an already-windowed dataset"""
+    html_content = generate_html(all_data)
+    with open('index.html', 'w', encoding='utf-8') as f:
+        f.write(html_content)
+    with open('sw.js', 'w', encoding='utf-8') as f:
+        f.write(generate_service_worker(get_kst_now().strftime('%Y%m%d%H%M%S')))
+    with open('manifest.webmanifest', 'w', encoding='utf-8') as f:
+        f.write(generate_web_manifest())
+
+def finalize_outputs(all_data, existing_dates):
+    """Image stages, then write_outputs; shared by the batch, daemon and CLI stage commands"""
+    with stage_deadline('images'):
+        validate_images(existing_dates)
+    if IMAGE_MIRROR:
+        with stage_deadline('mirror'):
+            mirror_images(existing_dates)
+    write_outputs(all_data, existing_dates)
+
+def write_outputs(all_data, existing_dates):
+    """Apply the 10-day window, then render and persist from the same in-memory dataset
+    
+    all_news.json and the delta manifest are written on a worker thread while the
+    page is rendered, so nothing is re-read from disk.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    prev_dates = all_data.get('dates', [])
+    sorted_dates = sorted(existing_dates.values(), key=lambda x: x['date'], reverse=True)
+    all_data['dates'] = sorted_dates[:10]
+    if sorted_dates[10:]:
+        append_to_news_archive(sorted_dates[10:])
+    
+    hashes = page_hashes(all_data['dates'])
+    manifest = build_change_manifest(prev_dates, all_data['dates'], all_data.get('version', 0) + 1,
+                                     all_data.get('page_hashes'), hashes)
+    all_data['page_hashes'] = hashes
+    if manifest:
+        all_data['version'] = manifest['seq']
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        persist_jobs = [executor.submit(save_all_news, all_data)]
+        if manifest:
+            persist_jobs.append(executor.submit(write_change_manifest, manifest))
         
-        if news_items:
-            log_message("  Curating news (deduplicate & select top 30)...")
-            news_items = curate_news_list(news_items)
-            
-            for item in news_items:
-                item['original_title'] = item.get('title', '')
-                item['original_summary'] = item.get('description', '')[:300]
-            
-            log_message("  Crawling og:image for curated articles...")
-            for item in news_items:
-                if item.get('link') and not item.get('image'):
-                    source = item.get('source', '')
-                    
-                    if source not in ['Google News']:
-                        item['image'] = fetch_article_image(item['link'], None)
-                    else:
-                        item['image'] = None
+        render_site(all_data)
+        
+        for job in persist_jobs:
+            job.result()
+    
+    log_message(f"\nSaved {len(all_data['dates'])} days of data (10-day rolling window)")
+    
+    if ARCHIVE_RETENTION_DAYS > 0:
+        render_archive(all_data)
+    build_search_index(all_data)
+    update_trends(prev_dates, all_data['dates'])
+    if manifest:
+        added = sum(len(change['added']) for change in manifest['dates'].values())
+        updated = sum(len(change.get('updated', [])) for change in manifest['dates'].values())
+        log_message(f"Wrote delta {manifest['seq']}: {added} added, {updated} updated across {len(manifest['dates'])} date(s)")
+    log_message("Generated index.html, sw.js and manifest.webmanifest")
+
+def run_batch():
+    """Single pass over every source (the GitHub Actions cron entry point)"""
+    log_message("=" * 50)
+    log_message("AI News Shorts - Batch Processing Started")
+    log_message("=" * 50)
+    
+    all_data = load_all_news()
+    existing_dates = {d['date']: d for d in all_data.get('dates', [])}
+    existing_links = collect_existing_links(all_data)
+    
+    today = get_kst_today()
+    
+    log_message(f"\nFetching news for {today}...")
+    
+    start_run_deadline()
+    health = load_feed_health()
+    with stage_deadline('rss'):
+        news_items = fetch_all_news_for_date(today, existing_links, include_yesterday=True, health=health)
+    save_feed_health(health)
+    log_message(f"  Total collected: {len(news_items)} articles")
+    
+    if news_items:
+        news_items = process_new_articles(news_items, collect_window_articles(all_data), existing_dates)
+        date_count = merge_news_into_dates(existing_dates, news_items, today)
+        log_message(f"  Completed: {len(news_items)} new articles across {date_count} date(s)")
+    else:
+        log_message("  No new articles found for today")
+    
+    log_message("\n" + "=" * 50)
+    
+    with stage_deadline('huggingface'):
+        hf_models = process_huggingface_models(collect_models_cache(all_data))
+    
+    if hf_models:
+        merge_models_into_today(existing_dates, hf_models, today)
+    
+    finalize_outputs(all_data, existing_dates)
+    
+    total_articles = sum(len(d['news']) for d in all_data['dates'])
+    log_message(f"Total articles: {total_articles}")
+    
+    log_message("\n" + "=" * 50)
+    log_message("Processing Complete!")
+    log_message("=" * 50)
+
+# ============================================================
+# Daemon Mode (long-running, per-source adaptive polling)
+# ============================================================
+
+DAEMON_MIN_INTERVAL = 10 * 60            # never poll a feed more often than this
+DAEMON_MAX_INTERVAL = 6 * 60 * 60        # never leave a feed alone longer than this
+DAEMON_DEFAULT_INTERVAL = 3 * 60 * 60    # same cadence as the cron for feeds with no history
+DAEMON_TARGET_NEW_PER_POLL = 1           # aim for roughly this many new articles per poll
+DAEMON_FLUSH_DELAY = 5 * 60              # let arrivals accumulate before summarizing
+DAEMON_HF_INTERVAL = 3 * 60 * 60         # HuggingFace trending refresh interval
+DAEMON_MAX_BACKOFF = 30 * 60             # cap on the sleep after consecutive failed iterations
+
+def clamp_poll_interval(seconds):
+    return max(DAEMON_MIN_INTERVAL, min(DAEMON_MAX_INTERVAL, seconds))
+
+def estimate_source_intervals(all_data):
+    """Initial poll interval per source from its observed publish rate in the window
+    
+    AI Times publishes hundreds of articles per 10 days while MIT News publishes a
+    handful, so busy feeds start near DAEMON_MIN_INTERVAL and quiet ones near the max.
+    Stored counts are post-curation, so adapt_poll_interval refines them from real polls.
+    """
+    from collections import Counter
+    counts = Counter()
+    for date_entry in all_data.get('dates', []):
+        for news in date_entry.get('news', []):
+            counts[news.get('source', '')] += 1
+    days = max(1, len(all_data.get('dates', [])))
+    
+    intervals = {}
+    for source in RSS_SOURCES:
+        per_day = counts[source['source']] / days
+        if per_day <= 0:
+            intervals[source['name']] = DAEMON_DEFAULT_INTERVAL
+        else:
+            intervals[source['name']] = clamp_poll_interval(86400 * DAEMON_TARGET_NEW_PER_POLL / per_day)
+    return intervals
+
+def adapt_poll_interval(interval, new_count):
+    """Shrink the interval for feeds that keep producing, back off on empty polls"""
+    if new_count == 0:
+        factor = 1.5
+    else:
+        factor = max(0.5, min(1.5, DAEMON_TARGET_NEW_PER_POLL / new_count))
+    return clamp_poll_interval(interval * factor)
+
+def run_daemon():
+    """Long-running scheduler: poll each feed on its own interval and append incrementally"""
+    log_message("=" * 50)
+    log_message("AI News Shorts - Daemon Mode Started")
+    log_message("=" * 50)
+    
+    all_data = load_all_news()
+    existing_dates = {d['date']: d for d in all_data.get('dates', [])}
+    seen_links = collect_existing_links(all_data)
+    models_cache = collect_models_cache(all_data)
+    health = load_feed_health()
+    
+    now = time.time()
+    intervals = estimate_source_intervals(all_data)
+    schedule = {}
+    for source in RSS_SOURCES:
+        schedule[source['name']] = {'interval': intervals[source['name']], 'next_poll': now}
+        log_message(f"  {source['name']}: polling every {int(intervals[source['name']] // 60)} min")
+    
+    pending = []
+    pending_since = None
+    next_hf_poll = now
+    changed = False
+    failures = 0
+    
+    while True:
+        try:
+            today = get_kst_today()
             
-            log_message("  Batch summarizing curated articles (10 at a time)...")
-            news_items = batch_summarize(news_items)
+            polled = False
+            for source in RSS_SOURCES:
+                state = schedule[source['name']]
+                if state['next_poll'] > time.time():
+                    continue
+                
+                # The adaptive interval already handles low yield; only honour open circuits here
+                open_until = get_feed_state(health, source['name']).get('open_until', 0)
+                if open_until > time.time():
+                    state['next_poll'] = open_until
+                    log_message(f"  {source['name']}: circuit open, next poll in {int((open_until - time.time()) // 60)} min")
+                    continue
+                
+                with run_deadline(), stage_deadline('rss'):
+                    news = fetch_rss_news(source, today, include_yesterday=True, health=health)
+                new_items = [item for item in news if item['link'] not in seen_links]
+                record_feed_yield(health, source['name'], len(new_items))
+                polled = True
+                for item in new_items:
+                    seen_links.add(item['link'])
+                pending.extend(new_items)
+                if new_items and pending_since is None:
+                    pending_since = time.time()
+                
+                state['interval'] = adapt_poll_interval(state['interval'], len(new_items))
+                state['next_poll'] = time.time() + state['interval']
+                log_message(f"  {source['name']}: {len(new_items)} new articles, next poll in {int(state['interval'] // 60)} min")
             
-            from collections import defaultdict
-            news_by_date = defaultdict(list)
-            for item in news_items:
-                item_date = item.get('date', today)
-                news_by_date[item_date].append(item)
+            if polled:
+                save_feed_health(health)
             
-            for news_date, date_news_items in news_by_date.items():
-                existing_date_news = existing_dates.get(news_date, {}).get('news', [])
-                # Only filter out AI Models for TODAY (they get re-added by HuggingFace processing)
-                # Preserve AI Models on past dates
-                if news_date == today:
-                    existing_date_news_filtered = [n for n in existing_date_news if n.get('category') != 'AI Model']
-                else:
-                    existing_date_news_filtered = existing_date_news
-                combined_news = date_news_items + existing_date_news_filtered
-                
-                existing_dates[news_date] = {
-                    'date': news_date,
-                    'update_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'news': combined_news
-                }
-                log_message(f"  Added {len(date_news_items)} articles to {news_date}")
+            if pending and time.time() - pending_since >= DAEMON_FLUSH_DELAY:
+                log_message(f"Processing {len(pending)} pending articles...")
+                with run_deadline():
+                    news_items = process_new_articles(pending, collect_window_articles(all_data), existing_dates)
+                merge_news_into_dates(existing_dates, news_items, today)
+                # Cleared only once merged, so a failed flush is retried with the same articles
+                pending = []
+                pending_since = None
+                changed = True
             
-            log_message(f"  Completed: {len(news_items)} new articles across {len(news_by_date)} date(s)")
-        else:
-            log_message("  No new articles found for today")
-        
-        log_message("\n" + "=" * 50)
-        
-        existing_models_cache = {}
-        for date_entry in all_data.get('dates', []):
-            for news in date_entry.get('news', []):
-                if news.get('category') == 'AI Model' and news.get('link'):
-                    existing_models_cache[news['link']] = news
-        
-        hf_models = process_huggingface_models(existing_models_cache)
-        
-        if hf_models:
-            existing_today_entry = existing_dates.get(today, {'date': today, 'update_time': '', 'news': []})
-            existing_news = [n for n in existing_today_entry.get('news', []) if n.get('category') != 'AI Model']
-            combined_news = existing_news + hf_models
+            if time.time() >= next_hf_poll:
+                with run_deadline(), stage_deadline('huggingface'):
+                    hf_models = process_huggingface_models(models_cache)
+                if hf_models:
+                    merge_models_into_today(existing_dates, hf_models, today)
+                    changed = True
+                next_hf_poll = time.time() + DAEMON_HF_INTERVAL
             
-            existing_dates[today] = {
-                'date': today,
-                'update_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'news': combined_news
-            }
-            log_message(f"  Added {len(hf_models)} HuggingFace models to today's feed")
-        
-        sorted_dates = sorted(existing_dates.values(), key=lambda x: x['date'], reverse=True)
-        all_data['dates'] = sorted_dates[:10]
-        
-        save_all_news(all_data)
-        log_message(f"\nSaved {len(all_data['dates'])} days of data (10-day rolling window)")
-        
-        html_content = generate_html([])
-        with open('index.html', 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        log_message(f"\nGenerated index.html")
-        
-        total_articles = sum(len(d['news']) for d in all_data['dates'])
-        log_message(f"Total articles: {total_articles}")
-        
-        log_message("\n" + "=" * 50)
-        log_message("Processing Complete!")
-        log_message("=" * 50)
+            if changed:
+                with run_deadline():
+                    finalize_outputs(all_data, existing_dates)
+                existing_dates = {d['date']: d for d in all_data['dates']}
+                # Only models still inside the window can be reused
+                models_cache = collect_models_cache(all_data)
+                changed = False
+            failures = 0
+        except Exception as e:
+            failures += 1
+            backoff = min(DAEMON_MAX_BACKOFF, 60 * 2 ** (failures - 1))
+            log_message(f"Daemon iteration failed ({failures} in a row): {type(e).__name__}: {e}; retrying in {backoff}s")
+            time.sleep(backoff)
+            continue
         
+        wake_times = [state['next_poll'] for state in schedule.values()] + [next_hf_poll]
+        if pending_since is not None:
+            wake_times.append(pending_since + DAEMON_FLUSH_DELAY)
+        time.sleep(max(1, min(wake_times) - time.time()))
+
+# ============================================================
+# Command Line (individual stages over persisted artifacts)
+# ============================================================
+
+ARTIFACT_DIR = 'artifacts'
+FETCHED_ARTIFACT = os.path.join(ARTIFACT_DIR, 'fetched.json')
+
+def save_fetched(news_items, path=FETCHED_ARTIFACT):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json_dumps({
+            'fetched_at': get_kst_timestamp(),
+            'articles': [item.to_dict() if isinstance(item, Article) else dict(item) for item in news_items]
+        }))
+
+def load_fetched(path=FETCHED_ARTIFACT):
+    try:
+        with open(path, 'rb') as f:
+            data = json_loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return None
+    return [Article(item) for item in data.get('articles', [])]
+
+def command_fetch(args):
+    """RSS collection only; new articles are saved to artifacts/fetched.json"""
+    all_data = load_all_news()
+    existing_links = collect_existing_links(all_data)
+    previous = load_fetched() or []
+    existing_links |= {item['link'] for item in previous if item.get('link')}
+    
+    start_run_deadline()
+    health = load_feed_health()
+    with stage_deadline('rss'):
+        news_items = fetch_all_news_for_date(get_kst_today(), existing_links, include_yesterday=True, health=health)
+    save_feed_health(health)
+    
+    save_fetched(previous + news_items)
+    log_message(f"Fetched {len(news_items)} new articles ({len(previous) + len(news_items)} pending in {FETCHED_ARTIFACT})")
+
+def command_summarize(args):
+    """Curate and summarize artifacts/fetched.json, merge into all_news.json and write outputs"""
+    news_items = load_fetched()
+    if not news_items:
+        log_message(f"Nothing to summarize: run 'fetch' first ({FETCHED_ARTIFACT} is missing or empty)")
+        return
+    
+    all_data = load_all_news()
+    existing_dates = {d['date']: d for d in all_data.get('dates', [])}
+    existing_links = collect_existing_links(all_data)
+    news_items = [item for item in news_items if item.get('link') not in existing_links]
+    
+    start_run_deadline()
+    news_items = process_new_articles(news_items, collect_window_articles(all_data), existing_dates)
+    date_count = merge_news_into_dates(existing_dates, news_items, get_kst_today())
+    log_message(f"  Completed: {len(news_items)} new articles across {date_count} date(s)")
+    finalize_outputs(all_data, existing_dates)
+    os.remove(FETCHED_ARTIFACT)
+
+def command_models(args):
+    """Refresh today's HuggingFace trending models only"""
+    all_data = load_all_news()
+    existing_dates = {d['date']: d for d in all_data.get('dates', [])}
+    
+    start_run_deadline()
+    with stage_deadline('huggingface'):
+        hf_models = process_huggingface_models(collect_models_cache(all_data))
+    if not hf_models:
+        log_message("No models fetched, outputs left unchanged")
+        return
+    merge_models_into_today(existing_dates, hf_models, get_kst_today())
+    finalize_outputs(all_data, existing_dates)
+
+def command_render(args):
+    """Re-render pages from all_news.json without touching data, deltas or any network"""
+    started = time.time()
+    all_data = load_all_news()
+    render_site(all_data)
+    if args.archive:
+        render_archive(all_data, force=True)
+    if args.search:
+        build_search_index(all_data)
+    log_message(f"Rendered {len(all_data.get('dates', []))} days in {time.time() - started:.2f}s")
+
+def build_arg_parser():
+    import argparse
+    parser = argparse.ArgumentParser(description='AI News Shorts pipeline')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    
+    commands.add_parser('run', help='full pipeline: fetch, curate, summarize, models, render (default)')
+    commands.add_parser('fetch', help='collect RSS articles into artifacts/fetched.json')
+    commands.add_parser('summarize', help='curate/summarize fetched articles, merge and write outputs')
+    commands.add_parser('models', help='refresh HuggingFace trending models only')
+    render = commands.add_parser('render', help='re-render index.html from all_news.json')
+    render.add_argument('--archive', action='store_true', help='also re-render every archive page')
+    render.add_argument('--search', action='store_true', help='also rebuild the search index')
+    commands.add_parser('daemon', help='long-running adaptive polling')
+    benchmark = commands.add_parser('benchmark-json', help='time JSON backends on the stored dataset')
+    benchmark.add_argument('--scale', type=int, default=10, help='replicate the dataset this many times')
+    return parser
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # Flags from before the subcommands existed
+    legacy = {'--daemon': 'daemon', '--benchmark-json': 'benchmark-json'}
+    argv = [legacy.get(arg, arg) for arg in argv]
+    args = build_arg_parser().parse_args(argv)
+    
+    command = args.command or 'run'
+    if command == 'run':
+        run_batch()
+    elif command == 'fetch':
+        command_fetch(args)
+    elif command == 'summarize':
+        command_summarize(args)
+    elif command == 'models':
+        command_models(args)
+    elif command == 'render':
+        command_render(args)
+    elif command == 'daemon':
+        run_daemon()
+    elif command == 'benchmark-json':
+        benchmark_json(args.scale)
+
+if __name__ == '__main__':
+    try:
+        main()
+    except KeyboardInterrupt:
+        log_message("Interrupted")
     except Exception as e:
         log_message(f"Error: {e}")
         import traceback